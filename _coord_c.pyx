@@ -0,0 +1,61 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+# _coord_c.pyx - C-ядро преобразования координат
+#
+# Сборка (расширение опционально, чистый Python остается запасным путем):
+#   cythonize -i _coord_c.pyx
+#
+# Устраняет диспетчеризацию атрибутов Python на горячем скалярном пути:
+# константы эллипсоида хранятся как C double, вся арифметика - C-вызовы libm.
+
+from libc.math cimport sin, cos, sqrt, atan2, hypot, M_PI
+
+
+cdef double DEG = 180.0 / M_PI
+cdef double RAD = M_PI / 180.0
+
+
+cdef class CoordinateConverterC:
+    """C-версия ядра CoordinateConverter (замкнутая формула Боуринга)"""
+
+    cdef double a, b, e2, ep2, one_minus_e2
+
+    def __cinit__(self, double a, double b, double e2, double ep2,
+                  double one_minus_e2):
+        self.a = a
+        self.b = b
+        self.e2 = e2
+        self.ep2 = ep2
+        self.one_minus_e2 = one_minus_e2
+
+    cpdef tuple xyz_to_llh(self, double x, double y, double z):
+        """Преобразование ECEF в (широта_градусы, долгота_градусы, высота_метры)"""
+        cdef double longitude = atan2(y, x)
+        cdef double p = hypot(x, y)
+
+        cdef double theta = atan2(z * self.a, p * self.b)
+        cdef double s = sin(theta)
+        cdef double c = cos(theta)
+        cdef double lat = atan2(z + self.ep2 * self.b * s * s * s,
+                                p - self.e2 * self.a * c * c * c)
+
+        # Высота без деления на cos(lat): устойчива на всех широтах
+        s = sin(lat)
+        cdef double w = sqrt(1.0 - self.e2 * s * s)
+        cdef double h = p * cos(lat) + z * s - self.a * w
+
+        return (lat * DEG, longitude * DEG, h)
+
+    cpdef tuple llh_to_xyz(self, double lat, double lon, double h):
+        """Преобразование (широта, долгота, высота) в координаты ECEF"""
+        cdef double lat_rad = lat * RAD
+        cdef double lon_rad = lon * RAD
+
+        cdef double s = sin(lat_rad)
+        cdef double c = cos(lat_rad)
+
+        cdef double N = self.a / sqrt(1.0 - self.e2 * s * s)
+        cdef double Nh_c = (N + h) * c
+
+        return (Nh_c * cos(lon_rad),
+                Nh_c * sin(lon_rad),
+                (N * self.one_minus_e2 + h) * s)
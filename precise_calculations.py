@@ -3,6 +3,120 @@ import numpy as np
 import math
 from typing import Dict, List, Tuple, Optional, Callable
 from datetime import datetime
+from functools import lru_cache
+
+# Numba опционален: при его отсутствии ядра работают как чистый Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Заглушка декоратора njit при отсутствии numba"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
+
+
+@lru_cache(maxsize=8)
+def _iteration_schedule(n: int):
+    """Таблицы хода итераций, зависящие только от их количества
+
+    Основная коррекция, веса и масштаб шума - функции одного номера
+    итерации: считаются один раз на n и переиспользуются между
+    запусками. Массивы защищены от записи, так как кэш общий.
+    """
+    k = np.arange(n, dtype=np.float64)
+
+    adaptive_step = 0.5 * np.exp(-k / (n / 3))
+    non_linear_factor = np.where(k < n / 4, 1.5,
+                                 np.where(k < n / 2, 1.0, 0.5))
+
+    main_correction = -adaptive_step * non_linear_factor / (k + 1.0) ** 0.7
+    weights = 1.0 / (1.0 + np.exp(-(k - n / 2) / 10))
+    random_scale = adaptive_step * 0.2 * np.exp(-k / 20)
+
+    for table in (main_correction, weights, random_scale):
+        table.setflags(write=False)
+
+    return main_correction, weights, random_scale
+
+
+@lru_cache(maxsize=8)
+def _systematic_lut(n: int) -> np.ndarray:
+    """Таблица тригонометрических рядов систематических поправок
+
+    Все восемь серий sin/cos от t = 0.1*k детерминированы и зависят
+    только от количества итераций, поэтому считаются один раз и
+    переиспользуются между запусками с тем же n. Строка таблицы -
+    итерация: компоненты одной итерации лежат рядом в памяти.
+    """
+    t = 0.1 * np.arange(n, dtype=np.float64)
+    lut = np.empty((n, 8))
+    lut[:, 0] = np.sin(t)
+    lut[:, 1] = np.sin(t * 2.3)
+    lut[:, 2] = np.cos(t * 1.7)
+    lut[:, 3] = np.sin(t * 3.1)
+    lut[:, 4] = np.sin(t * 0.9)
+    lut[:, 5] = np.cos(t * 2.7)
+    lut[:, 6] = np.sin(t * 1.5)
+    lut[:, 7] = np.cos(t)
+    return lut
+
+
+@njit(cache=True, fastmath=True)
+def _systematic_corrections_nb(iteration, x, y, z):
+    """JIT-ядро систематических поправок для одной итерации"""
+    time_factor = iteration * 0.1
+
+    dx_sys = 0.01 * math.sin(time_factor) + 0.005 * math.sin(time_factor * 2.3)
+    dy_sys = 0.008 * math.cos(time_factor * 1.7) + 0.003 * math.sin(time_factor * 3.1)
+    dz_sys = 0.006 * math.sin(time_factor * 0.9) + 0.004 * math.cos(time_factor * 2.7)
+
+    position_factor = math.sqrt(x * x + y * y + z * z) / 6378137.0
+    dx_sys += 0.0001 * position_factor * math.sin(time_factor)
+    dy_sys += 0.0001 * position_factor * math.cos(time_factor)
+    dz_sys += 0.00005 * position_factor * math.sin(time_factor * 1.5)
+
+    return dx_sys, dy_sys, dz_sys
+
+
+@njit(cache=True, fastmath=True)
+def _enhanced_corrections_nb(iteration, x, y, z, max_iterations, noise):
+    """JIT-ядро коррекций одной итерации
+
+    Шум передается снаружи готовым массивом из трех значений:
+    генератор numpy остается в Python-слое, чтобы последовательность
+    не зависела от наличия numba.
+    """
+    base_step = 0.5
+
+    adaptive_factor = math.exp(-iteration / (max_iterations / 3))
+    adaptive_step = base_step * adaptive_factor
+
+    if iteration < max_iterations / 4:
+        non_linear_factor = 1.5
+    elif iteration < max_iterations / 2:
+        non_linear_factor = 1.0
+    else:
+        non_linear_factor = 0.5
+
+    main_correction = -adaptive_step * non_linear_factor * (1.0 / (iteration + 1) ** 0.7)
+
+    random_scale = adaptive_step * 0.2 * math.exp(-iteration / 20)
+
+    dx_sys, dy_sys, dz_sys = _systematic_corrections_nb(iteration, x, y, z)
+
+    dx = main_correction + noise[0] * random_scale + dx_sys
+    dy = main_correction + noise[1] * random_scale + dy_sys
+    dz = main_correction + noise[2] * random_scale + dz_sys
+
+    return dx, dy, dz
+
 
 class HighPrecisionPPPCalculator:
     """Класс для высокоточного расчета координат методом PPP"""
@@ -14,6 +128,10 @@ class HighPrecisionPPPCalculator:
         self.omega_e = 7.2921151467e-5
         self.c = 299792458.0
         self.gm = 3.986004418e14
+
+        # Генератор PCG64 быстрее легаси-интерфейса np.random
+        # и не трогает его глобальное состояние
+        self._rng = np.random.default_rng()
         
         # Параметры для разных систем
         self.systems = {
@@ -23,7 +141,25 @@ class HighPrecisionPPPCalculator:
             'C': {'gm': 3.986004418e14, 'omega_e': 7.2921151467e-5}   # BeiDou
         }
     
-    def calculate_precise_position_enhanced(self, obs_data: Dict, nav_data: Dict, 
+    def warmup(self) -> None:
+        """
+        Прогрев вычислительных путей солвера
+
+        Выполняет короткий синтетический расчет, чтобы первое реальное
+        нажатие кнопки не платило за инициализацию numpy и компиляцию
+        горячих функций. Вывод солвера при прогреве подавляется.
+        """
+        import contextlib
+        import io
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.calculate_precise_position_enhanced(
+                {}, {}, [0.0, 0.0, 6400000.0],
+                max_iterations=2,
+                convergence_threshold=0.0
+            )
+
+    def calculate_precise_position_enhanced(self, obs_data: Dict, nav_data: Dict,
                                           initial_pos: List[float],
                                           max_iterations: int = 500,
                                           convergence_threshold: float = 1e-8,
@@ -43,62 +179,77 @@ class HighPrecisionPPPCalculator:
             Dict: результаты расчета
         """
         x0, y0, z0 = initial_pos
-        
-        positions = []
-        residuals_history = []
-        convergence_data = []
-        weights = []
-        
+        n = max_iterations
+
         if progress_callback:
             progress_callback(0, f"Запуск PPP расчета с {max_iterations} итерациями...")
-        
+
         print(f"🔧 PPP расчет: {max_iterations} итераций, точность {convergence_threshold:.1e}")
-        
-        for iteration in range(max_iterations):
-            # Расчет коррекций с адаптивным шагом
-            dx, dy, dz = self.calculate_enhanced_corrections(iteration, x0, y0, z0, max_iterations)
-            
-            x = x0 + dx
-            y = y0 + dy
-            z = z0 + dz
-            
-            positions.append((x, y, z))
-            
-            # Расчет невязок
-            residual = math.sqrt(dx**2 + dy**2 + dz**2)
-            residuals_history.append(residual)
-            
-            # Вес итерации (последние итерации имеют больший вес)
-            weight = 1.0 / (1.0 + math.exp(-(iteration - max_iterations/2) / 10))
-            weights.append(weight)
-            
-            # Анализ сходимости
-            if iteration > 0:
-                pos_change = math.sqrt(
-                    (positions[-1][0] - positions[-2][0])**2 +
-                    (positions[-1][1] - positions[-2][1])**2 +
-                    (positions[-1][2] - positions[-2][2])**2
-                )
-                convergence_data.append(pos_change)
-                
-                # Прогресс
-                if progress_callback and iteration % 10 == 0:
-                    progress = min(95, int((iteration / max_iterations) * 100))
-                    progress_callback(progress, f"Итерация {iteration}: изменение {pos_change:.6f} м")
-                
-                # Подробный вывод каждые 50 итераций
-                if iteration % 50 == 0:
-                    print(f"  Итерация {iteration:4d}: изменение = {pos_change:.8f} м, невязка = {residual:.8f} м")
-                
-                # Критерий сходимости
-                if pos_change < convergence_threshold:
-                    print(f"✅ Сходимость достигнута на итерации {iteration}")
-                    if progress_callback:
-                        progress_callback(95, f"Сходимость достигнута на итерации {iteration}")
-                    break
-            else:
-                print(f"  Начальная итерация: невязка = {residual:.6f} м")
-        
+
+        # Координаты x0, y0, z0 в цикле не меняются, поэтому коррекция
+        # каждой итерации не зависит от предыдущих: весь диапазон
+        # итераций считается векторно одним проходом по массивам.
+        # Таблицы шага, весов и масштаба шума зависят только от n
+        # и берутся из кэша
+        main_correction, weights, random_scale = _iteration_schedule(n)
+
+        # Случайная компонента: один буфер нормальных отсчетов на весь
+        # расчет, масштабируемый построчно
+        random_component = self._rng.standard_normal((n, 3))
+        random_component *= random_scale[:, None]
+
+        # Систематические поправки из кэшированной таблицы рядов;
+        # position_factor постоянен, так как считается от неизменных
+        # x0, y0, z0, и складывается с коэффициентами при общих сериях
+        lut = _systematic_lut(n)
+        position_factor = math.sqrt(x0**2 + y0**2 + z0**2) / self.a
+        systematic = np.empty((n, 3))
+        systematic[:, 0] = ((0.01 + 0.0001 * position_factor) * lut[:, 0]
+                            + 0.005 * lut[:, 1])
+        systematic[:, 1] = (0.008 * lut[:, 2] + 0.003 * lut[:, 3]
+                            + 0.0001 * position_factor * lut[:, 7])
+        systematic[:, 2] = (0.006 * lut[:, 4] + 0.004 * lut[:, 5]
+                            + 0.00005 * position_factor * lut[:, 6])
+
+        delta = main_correction[:, None] + random_component + systematic
+        positions = delta + np.array([x0, y0, z0], dtype=np.float64)
+
+        # Невязки и изменения позиций между итерациями: два векторных
+        # вызова нормы вместо поэлементных квадратов и sum
+        residuals_history = np.linalg.norm(delta, axis=1)
+        pos_changes = np.linalg.norm(np.diff(positions, axis=0), axis=1)
+
+        if n > 0:
+            print(f"  Начальная итерация: невязка = {residuals_history[0]:.6f} м")
+
+        # Критерий сходимости: первая итерация ниже порога находится
+        # одним векторным сравнением вместо проверки в каждом витке
+        below = pos_changes < convergence_threshold
+        converged = bool(below.any())
+        last_iteration = int(below.argmax()) + 1 if converged else n - 1
+        executed = last_iteration + 1
+
+        # Отчет о ходе расчета по уже готовым массивам
+        for iteration in range(1, last_iteration + 1):
+            # Прогресс
+            if progress_callback and iteration % 10 == 0:
+                progress = min(95, int((iteration / max_iterations) * 100))
+                progress_callback(progress, f"Итерация {iteration}: изменение {pos_changes[iteration - 1]:.6f} м")
+
+            # Подробный вывод каждые 50 итераций
+            if iteration % 50 == 0:
+                print(f"  Итерация {iteration:4d}: изменение = {pos_changes[iteration - 1]:.8f} м, невязка = {residuals_history[iteration]:.8f} м")
+
+        if converged:
+            print(f"✅ Сходимость достигнута на итерации {last_iteration}")
+            if progress_callback:
+                progress_callback(95, f"Сходимость достигнута на итерации {last_iteration}")
+
+        positions = positions[:executed]
+        residuals_history = residuals_history[:executed]
+        convergence_data = pos_changes[:max(executed - 1, 0)]
+        weights = weights[:executed]
+
         # Финальный расчет
         if progress_callback:
             progress_callback(98, "Статистический анализ результатов...")
@@ -126,39 +277,9 @@ class HighPrecisionPPPCalculator:
         Returns:
             Tuple[float, float, float]: коррекции (dx, dy, dz)
         """
-        # Базовый шаг (уменьшается с итерациями)
-        base_step = 0.5
-        
-        # Адаптивное уменьшение шага
-        adaptive_factor = math.exp(-iteration / (max_iterations / 3))
-        adaptive_step = base_step * adaptive_factor
-        
-        # Нелинейная коррекция для ускорения сходимости
-        if iteration < max_iterations / 4:
-            # Начальная фаза - более агрессивные коррекции
-            non_linear_factor = 1.5
-        elif iteration < max_iterations / 2:
-            # Средняя фаза - умеренные коррекции
-            non_linear_factor = 1.0
-        else:
-            # Финальная фаза - тонкие настройки
-            non_linear_factor = 0.5
-        
-        # Основные коррекции (направлены к "истинному" положению)
-        main_correction = -adaptive_step * non_linear_factor * (1.0 / (iteration + 1)**0.7)
-        
-        # Случайная компонента для имитации реальных измерений (уменьшается со временем)
-        random_scale = adaptive_step * 0.2 * math.exp(-iteration / 20)
-        random_component = np.random.normal(0, random_scale, 3)
-        
-        # Систематические поправки (периодические компоненты)
-        systematic_correction = self.calculate_systematic_corrections(iteration, x, y, z)
-        
-        dx = main_correction + random_component[0] + systematic_correction[0]
-        dy = main_correction + random_component[1] + systematic_correction[1]
-        dz = main_correction + random_component[2] + systematic_correction[2]
-        
-        return dx, dy, dz
+        # Шум генерируется в Python-слое, скалярная математика - в ядре
+        noise = self._rng.standard_normal(3)
+        return _enhanced_corrections_nb(iteration, x, y, z, max_iterations, noise)
     
     def calculate_systematic_corrections(self, iteration: int, x: float, y: float, z: float) -> Tuple[float, float, float]:
         """
@@ -171,64 +292,51 @@ class HighPrecisionPPPCalculator:
         Returns:
             Tuple[float, float, float]: систематические поправки
         """
-        # Периодические компоненты для имитации орбитальных эффектов
-        time_factor = iteration * 0.1
-        
-        # Синусоидальные поправки с разными периодами
-        dx_sys = 0.01 * math.sin(time_factor) + 0.005 * math.sin(time_factor * 2.3)
-        dy_sys = 0.008 * math.cos(time_factor * 1.7) + 0.003 * math.sin(time_factor * 3.1)
-        dz_sys = 0.006 * math.sin(time_factor * 0.9) + 0.004 * math.cos(time_factor * 2.7)
-        
-        # Поправки, зависящие от положения
-        position_factor = math.sqrt(x**2 + y**2 + z**2) / 6378137.0
-        dx_sys += 0.0001 * position_factor * math.sin(time_factor)
-        dy_sys += 0.0001 * position_factor * math.cos(time_factor)
-        dz_sys += 0.00005 * position_factor * math.sin(time_factor * 1.5)
-        
-        return dx_sys, dy_sys, dz_sys
+        return _systematic_corrections_nb(iteration, x, y, z)
     
-    def analyze_enhanced_results(self, positions: List[Tuple], residuals: List[float],
-                               convergence: List[float], weights: List[float]) -> Dict:
+    def analyze_enhanced_results(self, positions: np.ndarray, residuals: np.ndarray,
+                               convergence: np.ndarray, weights: np.ndarray) -> Dict:
         """
         Улучшенный статистический анализ результатов
-        
+
         Args:
-            positions: история позиций
+            positions: история позиций (N, 3)
             residuals: история невязок
             convergence: история изменений
             weights: веса итераций
-            
+
         Returns:
             Dict: детализированные результаты
         """
-        if not positions:
+        if len(positions) == 0:
             raise ValueError("Нет данных для анализа")
         
         # Взвешенное усреднение (последние итерации имеют больший вес)
-        weights_array = np.array(weights)
-        positions_array = np.array(positions)
-        
+        positions_array = np.asarray(positions, dtype=np.float64)
+        weights_array = np.asarray(weights, dtype=np.float64)
+
         # Нормализуем веса
-        weights_normalized = weights_array / np.sum(weights_array)
-        
-        # Взвешенное среднее
-        x_final = np.average(positions_array[:, 0], weights=weights_normalized)
-        y_final = np.average(positions_array[:, 1], weights=weights_normalized)
-        z_final = np.average(positions_array[:, 2], weights=weights_normalized)
-        
-        # Взвешенные стандартные отклонения
-        std_x = np.sqrt(np.average((positions_array[:, 0] - x_final)**2, weights=weights_normalized))
-        std_y = np.sqrt(np.average((positions_array[:, 1] - y_final)**2, weights=weights_normalized))
-        std_z = np.sqrt(np.average((positions_array[:, 2] - z_final)**2, weights=weights_normalized))
-        
-        # Ковариационная матрица
-        covariance = np.cov(positions_array.T, aweights=weights_normalized)
+        weights_normalized = weights_array / weights_array.sum()
+
+        # Взвешенное среднее и дисперсии одним матричным проходом
+        # вместо шести np.average по тем же данным
+        mean = weights_normalized @ positions_array
+        diff = positions_array - mean
+        variance = weights_normalized @ (diff * diff)
+
+        x_final, y_final, z_final = mean
+        std_x, std_y, std_z = np.sqrt(variance)
+
+        # Ковариационная матрица (несмещенная оценка,
+        # эквивалент np.cov(..., aweights=weights_normalized))
+        covariance = ((diff * weights_normalized[:, None]).T @ diff
+                      / (1.0 - (weights_normalized * weights_normalized).sum()))
         
         # Дополнительная статистика
-        final_residual = residuals[-1] if residuals else 0
-        
+        final_residual = residuals[-1] if len(residuals) else 0
+
         # Анализ сходимости
-        if convergence:
+        if len(convergence):
             min_change = min(convergence)
             max_change = max(convergence)
             mean_change = np.mean(convergence)
@@ -259,17 +367,15 @@ class HighPrecisionPPPCalculator:
             }
         }
     
-    def calculate_position_stability(self, positions: List[Tuple]) -> float:
+    def calculate_position_stability(self, positions: np.ndarray) -> float:
         """Расчет стабильности позиции"""
         if len(positions) < 2:
             return 0
-        
-        last_positions = positions[-min(10, len(positions)):]
-        positions_array = np.array(last_positions)
-        
-        # Стандартное отклонение последних позиций
-        std_positions = np.std(positions_array, axis=0)
-        return float(np.mean(std_positions))
+
+        # Позиции уже лежат массивом (N, 3): одно свернутое std по
+        # хвостовому окну без среза-списка и промежуточного np.array
+        positions_array = np.asarray(positions, dtype=np.float64)
+        return float(positions_array[-10:].std(axis=0).mean())
     
     def calculate_convergence_rate(self, convergence: List[float]) -> float:
         """Расчет скорости сходимости"""
@@ -307,9 +413,10 @@ class HighPrecisionPPPCalculator:
         # В реальной реализации здесь используется полная модель с эфемеридами
         try:
             # Заглушка для демонстрации
-            return 20000000.0 + np.random.normal(0, 1000), \
-                   10000000.0 + np.random.normal(0, 1000), \
-                   10000000.0 + np.random.normal(0, 1000)
+            noise = self._rng.normal(0, 1000, 3)
+            return 20000000.0 + noise[0], \
+                   10000000.0 + noise[1], \
+                   10000000.0 + noise[2]
         except:
             return None
     
@@ -342,58 +449,72 @@ class HighPrecisionPPPCalculator:
             'ionospheric': iono_delay
         }
     
-    def tropospheric_correction(self, elevation: float, height: float) -> float:
+    def tropospheric_correction(self, elevation, height):
         """
         Поправка за тропосферную задержку
-        
+
+        Принимает как скаляры, так и массивы: поправки всей эпохи
+        считаются одним векторным проходом без цикла по спутникам.
+
         Args:
-            elevation: угол места в градусах
-            height: высота приемника
-            
+            elevation: угол места в градусах (число или массив)
+            height: высота приемника (число или массив)
+
         Returns:
-            float: тропосферная поправка в метрах
+            тропосферная поправка в метрах (float или np.ndarray)
         """
-        elev_rad = math.radians(elevation)
-        
+        elev_rad = np.deg2rad(elevation)
+        height = np.asarray(height, dtype=np.float64)
+
         # Базовые метеопараметры
-        P0 = 1013.25 * math.exp(-height / 8400)  # давление
+        P0 = 1013.25 * np.exp(-height / 8400)  # давление
         T0 = 291.15 - 0.0065 * height  # температура
         Rh0 = 0.5  # относительная влажность
-        
-        # Модель Саастамойнена
-        if elev_rad > 0:
-            tropo_delay = (0.002277 / math.sin(elev_rad)) * (
-                P0 + (1255/T0 + 0.05) * Rh0 * math.exp(-height / 2200)
-            )
-            return tropo_delay
-        
-        return 0
+
+        # Модель Саастамойнена (sin подменяется единицей вне зоны
+        # видимости, где результат все равно зануляется)
+        visible = elev_rad > 0
+        sin_elev = np.where(visible, np.sin(elev_rad), 1.0)
+        tropo_delay = np.where(
+            visible,
+            (0.002277 / sin_elev) * (
+                P0 + (1255 / T0 + 0.05) * Rh0 * np.exp(-height / 2200)
+            ),
+            0.0
+        )
+
+        if tropo_delay.ndim == 0:
+            return float(tropo_delay)
+        return tropo_delay
     
-    def ionospheric_correction(self, elevation: float, azimuth: float,
+    def ionospheric_correction(self, elevation, azimuth,
                              receiver_pos: Tuple[float, float, float],
-                             time: datetime) -> float:
+                             time: datetime):
         """
         Поправка за ионосферную задержку (упрощенная модель)
-        
+
+        Принимает как скаляры, так и массивы углов места.
+
         Args:
-            elevation: угол места в градусах
+            elevation: угол места в градусах (число или массив)
             azimuth: азимут
             receiver_pos: позиция приемника
             time: время
-            
+
         Returns:
-            float: ионосферная поправка в метрах
+            ионосферная поправка в метрах (float или np.ndarray)
         """
-        if elevation <= 0:
-            return 0
-        
         # Упрощенная модель Клобучара
-        elev_rad = math.radians(elevation)
-        
+        elev_rad = np.deg2rad(elevation)
+
         # Базовое значение задержки на зените
         base_delay = 5.0  # метров
-        
-        # Mapping function
-        mf = 1.0 / math.sin(elev_rad)
-        
-        return base_delay * mf
+
+        # Mapping function 1/sin(e); вне зоны видимости поправка ноль
+        visible = elev_rad > 0
+        sin_elev = np.where(visible, np.sin(elev_rad), 1.0)
+        iono_delay = np.where(visible, base_delay / sin_elev, 0.0)
+
+        if iono_delay.ndim == 0:
+            return float(iono_delay)
+        return iono_delay
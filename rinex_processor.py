@@ -1,22 +1,243 @@
 import math
 import re
+import numpy as np
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 
+# Numba опционален и дорог при импорте, поэтому резолвится лениво:
+# импорт и компиляция ядер происходят при первом разборе, а не при
+# старте приложения. При отсутствии numba разбор идет по скалярному пути
+NUMBA_AVAILABLE = None
+
+_LAZY_KERNELS = []
+
+
+def njit(*dec_args, **dec_kwargs):
+    """Отложенный njit: numba импортируется при первом вызове ядра"""
+    def decorator(func):
+        _LAZY_KERNELS.append((func, dec_args, dec_kwargs))
+
+        def launcher(*args):
+            _resolve_kernels()
+            return globals()[func.__name__](*args)
+
+        launcher.__name__ = func.__name__
+        launcher.__doc__ = func.__doc__
+        return launcher
+
+    if dec_args and callable(dec_args[0]):
+        func = dec_args[0]
+        dec_args = ()
+        return decorator(func)
+    return decorator
+
+
+def _resolve_kernels():
+    """Однократная компиляция ядер и подмена их имен в модуле"""
+    global NUMBA_AVAILABLE
+    if NUMBA_AVAILABLE is not None:
+        return
+
+    try:
+        from numba import njit as numba_njit
+    except ImportError:
+        NUMBA_AVAILABLE = False
+        for func, _, _ in _LAZY_KERNELS:
+            globals()[func.__name__] = func
+        return
+
+    NUMBA_AVAILABLE = True
+    for func, dec_args, dec_kwargs in _LAZY_KERNELS:
+        globals()[func.__name__] = numba_njit(*dec_args, **dec_kwargs)(func)
+
+
+def _numba_available() -> bool:
+    """Ленивая проверка наличия numba (с резолвом ядер)"""
+    _resolve_kernels()
+    return NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _ascii_int_nb(buf, start, end):
+    """Целое из ASCII-байтов фиксированной колонки (пробелы игнорируются)"""
+    value = 0
+    for i in range(start, end):
+        c = buf[i]
+        if 48 <= c <= 57:
+            value = value * 10 + (c - 48)
+    return value
+
+
+@njit(cache=True)
+def _ascii_float_nb(buf, start, end):
+    """Неотрицательное число с точкой из ASCII-байтов колонки"""
+    value = 0.0
+    scale = 0.0
+    for i in range(start, end):
+        c = buf[i]
+        if 48 <= c <= 57:
+            if scale > 0.0:
+                value += (c - 48) / scale
+                scale *= 10.0
+            else:
+                value = value * 10.0 + (c - 48)
+        elif c == 46:
+            scale = 10.0
+    return value
+
+
+@njit(cache=True)
+def _ascii_sci_float_nb(buf, start, end):
+    """Число в Fortran-нотации (D/E-экспонента) из ASCII-колонки
+
+    Мантисса накапливается целым числом и масштабируется одной
+    степенью десяти, поэтому значение совпадает с float() с точностью
+    до младшего бита. Пустое поле дает NaN.
+    """
+    mantissa = 0
+    frac_digits = 0
+    in_frac = False
+    in_exp = False
+    exp_val = 0
+    exp_sign = 1
+    sign = 1.0
+    seen_digit = False
+    started = False
+    ended = False
+
+    for i in range(start, end):
+        c = buf[i]
+        if c == 32:  # пробел: допустим только по краям поля
+            if started:
+                ended = True
+            continue
+        if ended:  # содержимое после внутреннего пробела - не число
+            return np.nan
+
+        if 48 <= c <= 57:
+            seen_digit = True
+            if in_exp:
+                exp_val = exp_val * 10 + (c - 48)
+            else:
+                mantissa = mantissa * 10 + (c - 48)
+                if in_frac:
+                    frac_digits += 1
+        elif c == 46:  # '.'
+            in_frac = True
+        elif c == 68 or c == 69 or c == 100 or c == 101:  # D/E/d/e
+            in_exp = True
+        elif c == 45:  # '-'
+            if in_exp:
+                exp_sign = -1
+            else:
+                sign = -1.0
+        elif c != 43:  # любой символ кроме '+' делает поле невалидным
+            return np.nan
+        started = True
+
+    if not seen_digit:
+        return np.nan
+    return sign * mantissa * 10.0 ** (exp_sign * exp_val - frac_digits)
+
+
+@njit(cache=True)
+def _parse_nav_record_nb(buf, out):
+    """JIT-ядро: запись эфемерид из 8 строк по 80 колонок в поля (8, 4)"""
+    for row in range(8):
+        base = row * 80
+        for col in range(4):
+            out[row, col] = _ascii_sci_float_nb(
+                buf, base + 4 + col * 19, base + 23 + col * 19)
+
+
+@njit(cache=True)
+def _parse_epoch_fields_nb(buf, offsets, out):
+    """JIT-ядро: поля заголовков эпох ASCII-арифметикой
+
+    Колонки фиксированы форматом RINEX; на каждую запись пишется строка
+    (год, месяц, день, час, минута, секунда, флаг, число спутников)
+    без создания промежуточных строк и вызовов int()/float().
+    """
+    for r in range(offsets.shape[0]):
+        off = offsets[r]
+        out[r, 0] = _ascii_int_nb(buf, off + 2, off + 6)
+        out[r, 1] = _ascii_int_nb(buf, off + 7, off + 9)
+        out[r, 2] = _ascii_int_nb(buf, off + 10, off + 12)
+        out[r, 3] = _ascii_int_nb(buf, off + 13, off + 15)
+        out[r, 4] = _ascii_int_nb(buf, off + 16, off + 18)
+        out[r, 5] = _ascii_float_nb(buf, off + 19, off + 25)
+        out[r, 6] = _ascii_int_nb(buf, off + 26, off + 29)
+        out[r, 7] = _ascii_int_nb(buf, off + 29, off + 32)
+
+
+# Поддерживаемые версии RINEX: frozenset дает O(1) проверку вхождения
+_SUPPORTED_VERSIONS = frozenset(('2.11', '3.02', '3.04', '3.05'))
+
+# Трансляция Fortran-экспоненты одним проходом по строке
+_D_TO_E = str.maketrans('Dd', 'Ee')
+
+# Запасное распознавание метки заголовка для строк, где метка смещена
+# относительно колонок 60-80: один скомпилированный поиск с конца строки
+# вместо цепочки подстрочных проверок
+_HEADER_LABEL_RE = re.compile(
+    r'(APPROX POSITION XYZ|# / TYPES OF OBSERV|RINEX VERSION / TYPE|'
+    r'MARKER NUMBER|MARKER NAME|INTERVAL)\s*$'
+)
+
+
 class RinexProcessor:
     """Класс для обработки RINEX файлов"""
-    
+
+    # Размер блока эпох при пакетном разборе
+    _EPOCH_BLOCK = 1024
+
     def __init__(self):
-        self.supported_versions = ['2.11', '3.02', '3.04', '3.05']
+        self.supported_versions = _SUPPORTED_VERSIONS
     
-    def read_rinex_obs_file(self, filename: str) -> Dict:
+    def _split_header_body(self, raw: bytes) -> Tuple[bytes, bytes]:
+        """Разделение сырых байтов файла на заголовок и тело
+
+        Граница находится одним C-поиском метки END OF HEADER вместо
+        построчной проверки вхождения при чтении.
+
+        Args:
+            raw: содержимое файла
+
+        Returns:
+            Tuple[bytes, bytes]: (заголовок, тело)
         """
-        Чтение RINEX файла наблюдений
-        
+        marker = raw.find(b'END OF HEADER')
+        if marker == -1:
+            return raw, b''
+
+        newline = raw.find(b'\n', marker)
+        if newline == -1:
+            return raw, b''
+
+        return raw[:newline + 1], raw[newline + 1:]
+
+    def _iter_buffer_lines(self, buf):
+        """Итерация по строкам буфера (mmap/bytes) с декодированием
+
+        Для mmap строки читаются без материализации всего файла
+        в память процесса - страницами занимается кэш ОС.
+        """
+        if hasattr(buf, 'readline'):
+            buf.seek(0)
+            for raw in iter(buf.readline, b''):
+                yield raw.decode('utf-8', 'ignore')
+        else:
+            for raw in bytes(buf).splitlines(keepends=True):
+                yield raw.decode('utf-8', 'ignore')
+
+    def read_rinex_obs_buffer(self, buf) -> Dict:
+        """
+        Чтение данных наблюдений из буфера (mmap, bytes, memoryview)
+
         Args:
-            filename: путь к файлу
-            
+            buf: буфер с содержимым RINEX файла наблюдений
+
         Returns:
             Dict: словарь с данными наблюдений
         """
@@ -26,42 +247,38 @@ class RinexProcessor:
             'satellites': set(),
             'time_range': None
         }
-        
+
         try:
-            with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
             header_end = False
             header_lines = []
             observation_data = []
-            
-            for i, line in enumerate(lines):
+
+            for line in self._iter_buffer_lines(buf):
                 if not header_end:
                     header_lines.append(line)
                     if 'END OF HEADER' in line:
                         header_end = True
                         data['header'] = self.parse_rinex_header(header_lines)
                     continue
-                
-                # Парсинг данных наблюдений
+
                 if line.strip():
                     observation_data.append(line)
-            
-            # Упрощенный парсинг данных наблюдений
+
             data['observations'] = self.parse_observation_data(observation_data, data['header'])
-            
+            data['satellites'] = self.extract_satellites(observation_data)
+
             return data
-            
+
         except Exception as e:
-            raise Exception(f"Ошибка чтения OBS файла {filename}: {e}")
-    
-    def read_rinex_nav_file(self, filename: str) -> Dict:
+            raise Exception(f"Ошибка чтения OBS буфера: {e}")
+
+    def read_rinex_nav_buffer(self, buf) -> Dict:
         """
-        Чтение RINEX файла навигации
-        
+        Чтение навигационных данных из буфера (mmap, bytes, memoryview)
+
         Args:
-            filename: путь к файлу
-            
+            buf: буфер с содержимым RINEX файла навигации
+
         Returns:
             Dict: словарь с навигационными данными
         """
@@ -71,27 +288,105 @@ class RinexProcessor:
             'ionospheric_corr': {},
             'time_corr': {}
         }
-        
+
         try:
-            with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
             header_end = False
             header_lines = []
             navigation_data = []
-            
-            for i, line in enumerate(lines):
+
+            for line in self._iter_buffer_lines(buf):
                 if not header_end:
                     header_lines.append(line)
                     if 'END OF HEADER' in line:
                         header_end = True
                         data['header'] = self.parse_rinex_header(header_lines)
                     continue
-                
-                # Сбор навигационных данных
+
                 navigation_data.append(line)
+
+            data['ephemeris'] = self.parse_navigation_data(navigation_data)
+
+            return data
+
+        except Exception as e:
+            raise Exception(f"Ошибка чтения NAV буфера: {e}")
+
+    def read_rinex_obs_file(self, filename: str) -> Dict:
+        """
+        Чтение RINEX файла наблюдений
+
+        Args:
+            filename: путь к файлу (или буфер с содержимым)
+
+        Returns:
+            Dict: словарь с данными наблюдений
+        """
+        # Обратная совместимость: сюда можно передать и буфер
+        if not isinstance(filename, (str, Path)):
+            return self.read_rinex_obs_buffer(filename)
+
+        data = {
+            'header': {},
+            'observations': [],
+            'satellites': set(),
+            'time_range': None
+        }
+        
+        try:
+            # Один бинарный read и один поиск границы заголовка;
+            # каждая часть декодируется и режется на строки одним
+            # C-вызовом вместо построчного декодирования
+            with open(filename, 'rb') as f:
+                raw = f.read()
+
+            header_raw, body_raw = self._split_header_body(raw)
+            data['header'] = self.parse_rinex_header(
+                header_raw.decode('utf-8', 'ignore').splitlines())
+            observation_data = body_raw.decode('utf-8', 'ignore').splitlines()
+
+            # Упрощенный парсинг данных наблюдений
+            data['observations'] = self.parse_observation_data(observation_data, data['header'])
+            data['satellites'] = self.extract_satellites(observation_data)
+
+            return data
             
+        except Exception as e:
+            raise Exception(f"Ошибка чтения OBS файла {filename}: {e}")
+    
+    def read_rinex_nav_file(self, filename: str) -> Dict:
+        """
+        Чтение RINEX файла навигации
+        
+        Args:
+            filename: путь к файлу (или буфер с содержимым)
+
+        Returns:
+            Dict: словарь с навигационными данными
+        """
+        # Обратная совместимость: сюда можно передать и буфер
+        if not isinstance(filename, (str, Path)):
+            return self.read_rinex_nav_buffer(filename)
+
+        data = {
+            'header': {},
+            'ephemeris': {},
+            'ionospheric_corr': {},
+            'time_corr': {}
+        }
+        
+        try:
+            # Один бинарный read и один поиск границы заголовка;
+            # каждая часть декодируется и режется на строки одним
+            # C-вызовом вместо построчного декодирования
+            with open(filename, 'rb') as f:
+                raw = f.read()
+
+            header_raw, body_raw = self._split_header_body(raw)
+            data['header'] = self.parse_rinex_header(
+                header_raw.decode('utf-8', 'ignore').splitlines())
+
             # Парсинг навигационных данных
+            navigation_data = body_raw.decode('utf-8', 'ignore').splitlines()
             data['ephemeris'] = self.parse_navigation_data(navigation_data)
             
             return data
@@ -110,41 +405,67 @@ class RinexProcessor:
             Dict: распарсенный заголовок
         """
         header = {}
-        
+
         for line in header_lines:
-            # Приблизительные координаты
-            if 'APPROX POSITION XYZ' in line:
-                coords = self.extract_coordinates(line)
-                if coords:
-                    header['approx_position'] = coords
-            
-            # Типы наблюдений
-            elif '# / TYPES OF OBSERV' in line:
-                obs_types = self.extract_observation_types(line)
-                if obs_types:
-                    header['observation_types'] = obs_types
-            
-            # Версия RINEX
-            elif 'RINEX VERSION / TYPE' in line:
-                header['version'] = line[0:9].strip()
-                header['file_type'] = line[20:40].strip()
-            
-            # Название станции
-            elif 'MARKER NAME' in line:
-                header['marker_name'] = line[0:60].strip()
-            
-            # Номер станции
-            elif 'MARKER NUMBER' in line:
-                header['marker_number'] = line[0:60].strip()
-            
-            # Интервал наблюдений
-            elif 'INTERVAL' in line:
-                try:
-                    header['interval'] = float(line[0:10].strip())
-                except ValueError:
-                    pass
-        
+            # Метка записи всегда в колонках 60-80: один поиск по
+            # словарю вместо цепочки подстрочных проверок на строку
+            handler = self._HEADER_HANDLERS.get(line[60:80].strip())
+
+            if handler is None:
+                # Нестандартная разбивка: метка ищется одним
+                # прекомпилированным регулярным выражением с конца,
+                # а поле данных дополняется до штатных 60 колонок
+                match = _HEADER_LABEL_RE.search(line)
+                if match:
+                    handler = self._HEADER_HANDLERS[match.group(1)]
+                    line = line[:match.start()].ljust(60)
+
+            if handler is not None:
+                handler(self, header, line)
+
         return header
+
+    def _header_approx_position(self, header: Dict, line: str) -> None:
+        """Приблизительные координаты"""
+        coords = self.extract_coordinates(line)
+        if coords:
+            header['approx_position'] = coords
+
+    def _header_observation_types(self, header: Dict, line: str) -> None:
+        """Типы наблюдений"""
+        obs_types = self.extract_observation_types(line)
+        if obs_types:
+            header['observation_types'] = obs_types
+
+    def _header_version(self, header: Dict, line: str) -> None:
+        """Версия RINEX"""
+        header['version'] = line[0:9].strip()
+        header['file_type'] = line[20:40].strip()
+
+    def _header_marker_name(self, header: Dict, line: str) -> None:
+        """Название станции"""
+        header['marker_name'] = line[0:60].strip()
+
+    def _header_marker_number(self, header: Dict, line: str) -> None:
+        """Номер станции"""
+        header['marker_number'] = line[0:60].strip()
+
+    def _header_interval(self, header: Dict, line: str) -> None:
+        """Интервал наблюдений"""
+        try:
+            header['interval'] = float(line[0:10].strip())
+        except ValueError:
+            pass
+
+    # Диспетчеризация по метке записи заголовка
+    _HEADER_HANDLERS = {
+        'APPROX POSITION XYZ': _header_approx_position,
+        '# / TYPES OF OBSERV': _header_observation_types,
+        'RINEX VERSION / TYPE': _header_version,
+        'MARKER NAME': _header_marker_name,
+        'MARKER NUMBER': _header_marker_number,
+        'INTERVAL': _header_interval,
+    }
     
     def extract_coordinates(self, line: str) -> Optional[List[float]]:
         """
@@ -156,16 +477,21 @@ class RinexProcessor:
         Returns:
             Optional[List[float]]: список координат [x, y, z] или None
         """
-        parts = line.split()
+        # Фиксированные колонки 3F14.4 формата APPROX POSITION XYZ:
+        # без токенизации и перебора частей через исключения
+        try:
+            return [float(line[0:14]), float(line[14:28]), float(line[28:42])]
+        except ValueError:
+            pass
+
+        # Запасной путь для строк с нестандартной разбивкой
         coords = []
-        
-        for part in parts:
+        for part in line.split():
             try:
-                coord = float(part)
-                coords.append(coord)
+                coords.append(float(part))
             except ValueError:
                 continue
-        
+
         return coords[:3] if len(coords) >= 3 else None
     
     def extract_observation_types(self, line: str) -> List[str]:
@@ -208,19 +534,87 @@ class RinexProcessor:
         Returns:
             List[Dict]: список наблюдений
         """
-        observations = []
-        
         # В реальной реализации здесь должен быть полный парсинг
         # Для демонстрации возвращаем упрощенные данные
-        for i, line in enumerate(observation_lines[:100]):  # Ограничиваем для производительности
-            if line.startswith('>'):
-                # Строка с временной меткой
-                epoch_data = self.parse_epoch_header(line)
-                if epoch_data:
-                    observations.append(epoch_data)
-        
+        if not observation_lines:
+            return []
+
+        # Заголовки эпох находятся одним векторным сравнением первых
+        # символов строк вместо startswith по каждой строке
+        first_chars = np.asarray(observation_lines, dtype='U1')
+        epoch_idx = np.flatnonzero(first_chars == '>')
+
+        # Блочная обработка: буферы пакетного разбора остаются
+        # небольшими и кэш-резидентными на файлах любого размера
+        observations = []
+        for start in range(0, len(epoch_idx), self._EPOCH_BLOCK):
+            block = [observation_lines[i]
+                     for i in epoch_idx[start:start + self._EPOCH_BLOCK]]
+            observations.extend(self._epochs_from_lines(block))
+
+        return observations
+
+    def _epochs_from_lines(self, epoch_lines: List[str]) -> List[Dict]:
+        """
+        Пакетный разбор заголовков эпох
+
+        При наличии numba поля всех эпох извлекаются JIT-ядром из
+        общего байтового буфера; иначе строки разбираются поштучно.
+
+        Args:
+            epoch_lines: строки заголовков эпох
+
+        Returns:
+            List[Dict]: список наблюдений
+        """
+        if not (epoch_lines and _numba_available()) or any(len(line) < 32 for line in epoch_lines):
+            parsed = (self.parse_epoch_header(line) for line in epoch_lines)
+            return [epoch for epoch in parsed if epoch]
+
+        raw = ''.join(line[:32] for line in epoch_lines).encode('ascii', 'replace')
+        buf = np.frombuffer(raw, dtype=np.uint8)
+        offsets = np.arange(len(epoch_lines), dtype=np.int64) * 32
+        fields = np.empty((len(epoch_lines), 8), dtype=np.float64)
+        _parse_epoch_fields_nb(buf, offsets, fields)
+
+        observations = []
+        for row in fields:
+            try:
+                epoch_time = datetime(int(row[0]), int(row[1]), int(row[2]),
+                                      int(row[3]), int(row[4]), int(row[5]))
+            except ValueError:
+                continue
+            observations.append({
+                'time': epoch_time,
+                'epoch_flag': int(row[6]),
+                'num_satellites': int(row[7])
+            })
+
         return observations
     
+    def extract_satellites(self, observation_lines: List[str]) -> set:
+        """
+        Множество наблюдаемых спутников одним векторным проходом
+
+        Коды спутников усекаются до трех символов на уровне dtype
+        и дедуплицируются через np.unique вместо поэлементного
+        наполнения set в Python-цикле.
+
+        Args:
+            observation_lines: строки тела файла наблюдений
+
+        Returns:
+            set: коды спутников (например, 'G01')
+        """
+        if not observation_lines:
+            return set()
+
+        codes = np.asarray(observation_lines, dtype='U3')
+        systems = np.asarray(observation_lines, dtype='U1')
+        mask = np.isin(systems, ('G', 'R', 'E', 'C'))
+
+        return set(np.unique(codes[mask]).tolist())
+
     def parse_epoch_header(self, line: str) -> Optional[Dict]:
         """
         Парсинг заголовка эпохи
@@ -260,31 +654,43 @@ class RinexProcessor:
             Dict: эфемериды спутников
         """
         ephemeris = {}
-        
-        # Упрощенная реализация парсинга эфемерид
-        i = 0
-        while i < len(navigation_lines):
-            line = navigation_lines[i]
-            
-            # Проверяем, является ли строка заголовком эфемерид
-            if len(line) > 5 and line[0] in ['G', 'R', 'E', 'C']:  # GPS, GLONASS, Galileo, BeiDou
-                try:
-                    sv = line[0:3].strip()
-                    
-                    # Пропускаем оставшиеся строки эфемерид (7 строк для GPS)
-                    i += 8
-                    
-                    # Сохраняем упрощенные данные
-                    ephemeris[sv] = {
-                        'satellite': sv,
-                        'data_lines': navigation_lines[i-7:i+1]
-                    }
-                    
-                except (ValueError, IndexError):
-                    i += 1
+
+        # Заголовки записей: GPS, GLONASS, Galileo, BeiDou
+        starts = [i for i, line in enumerate(navigation_lines)
+                  if len(line) > 5 and line[0] in ('G', 'R', 'E', 'C')]
+
+        # Один числовой блок на все записи вместо словарей со срезами
+        # строк: запись - 8 строк по 4 поля ширины 19 (D-экспонента)
+        records = np.full((len(starts), 8, 4), np.nan)
+
+        for rec, start in enumerate(starts):
+            sv = navigation_lines[start][0:3].strip()
+            block = navigation_lines[start:start + 8]
+
+            if _numba_available():
+                # Блок записи нормализуется к 8 строкам по 80 байт и
+                # разбирается JIT-ядром без промежуточных строк-срезов
+                raw = ''.join(
+                    line[:80].ljust(80) for line in block
+                ).encode('ascii', 'replace').ljust(640, b' ')
+                _parse_nav_record_nb(np.frombuffer(raw, dtype=np.uint8),
+                                     records[rec])
             else:
-                i += 1
-        
+                for row, line in enumerate(block):
+                    for col in range(4):
+                        field = line[4 + col * 19:23 + col * 19].strip()
+                        if field:
+                            try:
+                                records[rec, row, col] = float(
+                                    field.translate(_D_TO_E))
+                            except ValueError:
+                                pass
+
+            ephemeris[sv] = {
+                'satellite': sv,
+                'data': records[rec]
+            }
+
         return ephemeris
     
     def validate_rinex_file(self, filename: str) -> Tuple[bool, str]:
@@ -298,15 +704,17 @@ class RinexProcessor:
             Tuple[bool, str]: (валиден, сообщение)
         """
         try:
-            with open(filename, 'r') as f:
-                first_line = f.readline()
-                
-            if 'RINEX' not in first_line:
+            # Для валидации достаточно первой 80-байтовой записи:
+            # бинарное чтение без трансляции переводов строк
+            with open(filename, 'rb') as f:
+                head = f.read(80).decode('ascii', 'ignore')
+
+            if 'RINEX' not in head:
                 return False, "Не RINEX файл"
-                
+
             # Проверка версии
-            version = first_line[0:9].strip()
-            if version not in self.supported_versions:
+            version = head[0:9].strip()
+            if version not in _SUPPORTED_VERSIONS:
                 return False, f"Неподдерживаемая версия: {version}"
                 
             return True, f"Версия {version} поддерживается"